@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 import logging
+import os
 from pathlib import Path
-import re
-from typing import Sequence
+import sys
+from typing import Callable, Iterator, Sequence
 
 from pdfeditor.detect_render import is_render_backend_available
-from pdfeditor.models import RunConfig
-from pdfeditor.processor import process_pdf
-from pdfeditor.reporting import build_run_result, write_run_reports
+from pdfeditor.discovery import discover_pdfs
+from pdfeditor.models import FileResult, RunConfig
 
-EDITED_INPUT_PATTERN = re.compile(r"\.edited(?:\.\d+)?\.pdf\Z", re.IGNORECASE)
 RenderSampleMargin = tuple[float, float, float, float]
 PageNumberBox = tuple[float, float, float, float]
 
+_WORKER_OUT_DIR: Path | None = None
+_WORKER_CONFIG: RunConfig | None = None
+
 
 def build_parser() -> argparse.ArgumentParser:
     """Create the command-line parser."""
@@ -151,6 +155,18 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print per-file processing details.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Maximum number of PDFs processed in parallel. Defaults to the CPU count.",
+    )
+    parser.add_argument(
+        "--worker-backend",
+        choices=("process", "thread"),
+        default="process",
+        help="Worker pool used when --workers is greater than 1. Defaults to process.",
+    )
     return parser
 
 
@@ -162,6 +178,8 @@ def run_cli(argv: Sequence[str] | None = None) -> int:
     _configure_pypdf_logging(capture_warnings=debug_pypdf_xref)
     _validate_cli_args(parser=parser, args=args)
 
+    from pdfeditor.reporting import build_run_result, write_run_reports
+
     scan_path = Path(args.path)
     out_dir = Path(args.out) if args.out is not None else scan_path
     report_dir = Path(args.report_dir) if args.report_dir is not None else scan_path
@@ -183,6 +201,17 @@ def run_cli(argv: Sequence[str] | None = None) -> int:
         )
         effective_mode = "structural"
 
+    worker_backend = str(args.worker_backend)
+    uses_pdfium = effective_mode in {"render", "both"} or bool(args.stamp_page_numbers)
+    if worker_backend == "thread" and args.workers > 1 and uses_pdfium:
+        # PDFium is not thread-safe, so files that render or stamp pages must
+        # not share one process.
+        run_warnings.append(
+            "Worker backend 'thread' is not supported with rendering or page-number "
+            "stamping because PDFium is not thread-safe; using 'process' instead."
+        )
+        worker_backend = "process"
+
     config = RunConfig(
         path=str(scan_path),
         out=str(out_dir),
@@ -214,32 +243,23 @@ def run_cli(argv: Sequence[str] | None = None) -> int:
         strict_xref=bool(args.strict_xref),
         debug_render=bool(args.debug_render),
         verbose=bool(args.verbose),
+        workers=int(args.workers),
+        worker_backend=worker_backend,
     )
 
     files = []
 
     report_dir.mkdir(parents=True, exist_ok=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
 
     if not run_errors and (not scan_path.exists() or not scan_path.is_dir()):
         run_errors.append(f"Scan path is not a directory: {scan_path}")
     elif not run_errors:
-        for pdf_path in discover_pdfs(scan_path, recursive=config.recursive):
-            file_result = process_pdf(pdf_path, out_dir=out_dir, config=config)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        pdf_paths = discover_pdfs(scan_path, recursive=config.recursive)
+        for file_result in _iter_file_results(pdf_paths, out_dir=out_dir, config=config):
             files.append(file_result)
             if config.verbose:
-                print(
-                    f"{file_result.status}: {pdf_path} "
-                    f"(removed={file_result.pages_removed}, output={file_result.output_path or '-'})"
-                )
-                if file_result.structural_debug_path is not None:
-                    print(f"wrote structural debug to {file_result.structural_debug_path}")
-                if file_result.pypdf_warnings_path is not None:
-                    print(f"wrote pypdf warnings debug to {file_result.pypdf_warnings_path}")
-                if file_result.render_debug_path is not None:
-                    print(f"wrote render debug to {file_result.render_debug_path}")
-                if file_result.stamping_debug_path is not None:
-                    print(f"wrote stamp debug to {file_result.stamping_debug_path}")
+                sys.stdout.write("\n".join(_verbose_lines(file_result)) + "\n")
 
     run_result = build_run_result(
         config=config,
@@ -263,27 +283,142 @@ def main(argv: Sequence[str] | None = None) -> None:
     raise SystemExit(run_cli(argv))
 
 
-def discover_pdfs(path: Path, recursive: bool) -> list[Path]:
-    """Discover candidate PDFs for processing."""
-    if recursive:
-        iterator = sorted(item for item in path.rglob("*") if item.is_file())
-    else:
-        iterator = sorted(item for item in path.iterdir() if item.is_file())
+def _verbose_lines(file_result: FileResult) -> list[str]:
+    """Return the verbose console lines for one processed file."""
+    lines = [
+        f"{file_result.status}: {file_result.input_path} "
+        f"(removed={file_result.pages_removed}, output={file_result.output_path or '-'})"
+    ]
+    if file_result.structural_debug_path is not None:
+        lines.append(f"wrote structural debug to {file_result.structural_debug_path}")
+    if file_result.pypdf_warnings_path is not None:
+        lines.append(f"wrote pypdf warnings debug to {file_result.pypdf_warnings_path}")
+    if file_result.render_debug_path is not None:
+        lines.append(f"wrote render debug to {file_result.render_debug_path}")
+    if file_result.stamping_debug_path is not None:
+        lines.append(f"wrote stamp debug to {file_result.stamping_debug_path}")
+    return lines
+
+
+def _iter_file_results(
+    pdf_paths: list[Path],
+    out_dir: Path,
+    config: RunConfig,
+) -> Iterator[FileResult]:
+    """Yield file results in discovery order, processing files in parallel when enabled."""
+    from pdfeditor.processor import build_failed_file_result, process_pdf
+
+    groups = _group_by_output_stem(pdf_paths)
+    max_workers = min(config.workers, len(groups))
+    if max_workers <= 1:
+        for pdf_path in pdf_paths:
+            yield process_pdf(pdf_path, out_dir=out_dir, config=config)
+        return
+
+    executor, task = _build_executor(out_dir=out_dir, config=config, max_workers=max_workers)
+    with executor:
+        # Only a bounded window of groups is in flight, so results that finish
+        # ahead of the discovery order cannot pile up for large runs.
+        window = _SUBMIT_WINDOW_PER_WORKER * max_workers
+        pending_groups = iter(groups)
+        futures: dict[Path, tuple[Future[list[FileResult]], int]] = {}
+        unyielded: dict[Future[list[FileResult]], int] = {}
+
+        def submit_next_group() -> bool:
+            group = next(pending_groups, None)
+            if group is None:
+                return False
+            try:
+                future = executor.submit(task, group)
+            except Exception as exc:
+                # A broken pool (e.g. a worker killed by a crash) refuses new
+                # work; the group's files are reported as failed and the run
+                # keeps draining so the reports are still written.
+                future = Future()
+                future.set_exception(exc)
+            unyielded[future] = len(group)
+            for position, pdf_path in enumerate(group):
+                futures[pdf_path] = (future, position)
+            return True
+
+        for pdf_path in pdf_paths:
+            while (pdf_path not in futures or len(unyielded) < window) and submit_next_group():
+                pass
+            future, position = futures.pop(pdf_path)
+            try:
+                file_result = future.result()[position]
+            except Exception as exc:
+                file_result = build_failed_file_result(
+                    input_path=pdf_path,
+                    config=config,
+                    errors=[f"worker_error: {exc}"],
+                )
+            unyielded[future] -= 1
+            if unyielded[future] == 0:
+                del unyielded[future]
+            yield file_result
+
+
+_SUBMIT_WINDOW_PER_WORKER = 2
+
+
+def _group_by_output_stem(pdf_paths: list[Path]) -> list[list[Path]]:
+    """Group inputs that share output and artifact names so they run sequentially."""
+    groups: dict[str, list[Path]] = {}
+    for pdf_path in pdf_paths:
+        groups.setdefault(pdf_path.stem.casefold(), []).append(pdf_path)
+    return list(groups.values())
+
+
+def _build_executor(
+    out_dir: Path,
+    config: RunConfig,
+    max_workers: int,
+) -> tuple[Executor, Callable[[list[Path]], list[FileResult]]]:
+    """Create the bounded worker pool and the task each input group is submitted to.
+
+    Process workers receive the output directory and run configuration once
+    through the pool initializer, so each submitted task only pickles its
+    input paths.
+    """
+    from pdfeditor.processor import process_pdfs
+
+    if config.worker_backend == "thread":
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        return executor, partial(process_pdfs, out_dir=out_dir, config=config)
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(out_dir, config),
+    )
+    return executor, _process_worker_group
+
+
+def _init_worker(out_dir: Path, config: RunConfig) -> None:
+    """Store shared run settings in a worker process and configure pypdf logging."""
+    global _WORKER_OUT_DIR, _WORKER_CONFIG
+    _configure_pypdf_logging(capture_warnings=config.debug_pypdf_xref)
+    _WORKER_OUT_DIR = out_dir
+    _WORKER_CONFIG = config
+
+
+def _process_worker_group(input_paths: list[Path]) -> list[FileResult]:
+    """Process one input group with the settings stored by `_init_worker`."""
+    from pdfeditor.processor import process_pdfs
 
-    candidates: list[Path] = []
-    for item in iterator:
-        if item.suffix.lower() != ".pdf":
-            continue
-        if EDITED_INPUT_PATTERN.search(item.name):
-            continue
-        candidates.append(item)
-    return candidates
+    if _WORKER_OUT_DIR is None or _WORKER_CONFIG is None:
+        raise RuntimeError("Worker process was not initialized.")
+    return process_pdfs(input_paths, out_dir=_WORKER_OUT_DIR, config=_WORKER_CONFIG)
 
 
 def _configure_pypdf_logging(capture_warnings: bool) -> None:
-    """Suppress pypdf warning spam unless explicit capture is enabled."""
+    """Suppress pypdf warning spam unless explicit capture is enabled.
+
+    Without capture, the logger level is raised above CRITICAL so pypdf log
+    calls short-circuit before a LogRecord is built.
+    """
     logger = logging.getLogger("pypdf")
-    logger.setLevel(logging.WARNING if capture_warnings else logging.ERROR)
+    logger.setLevel(logging.WARNING if capture_warnings else logging.CRITICAL + 1)
     logger.propagate = False
     if not any(isinstance(handler, logging.NullHandler) for handler in logger.handlers):
         logger.addHandler(logging.NullHandler())
@@ -315,26 +450,21 @@ def _parse_box_floats(
     names: str,
 ) -> tuple[float, float, float, float]:
     """Parse four non-negative floats from a comma-separated CLI value."""
-    parts = [part.strip() for part in value.split(",")]
+    parts = value.split(",")
     if len(parts) != 4:
         raise argparse.ArgumentTypeError(
             f"{label} must contain exactly 4 comma-separated values: {names}"
         )
-
-    values: list[float] = []
-    for part in parts:
-        try:
-            number = float(part)
-        except ValueError as exc:
-            raise argparse.ArgumentTypeError(
-                f"{label} values must be numbers in inches"
-            ) from exc
-        if number < 0:
-            raise argparse.ArgumentTypeError(
-                f"{label} values must be >= 0 inches"
-            )
-        values.append(number)
-    first, second, third, fourth = values
+    try:
+        first, second, third, fourth = (float(part) for part in parts)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"{label} values must be numbers in inches"
+        ) from exc
+    if any(number < 0 for number in (first, second, third, fourth)):
+        raise argparse.ArgumentTypeError(
+            f"{label} values must be >= 0 inches"
+        )
     return (first, second, third, fourth)
 
 
@@ -344,3 +474,5 @@ def _validate_cli_args(parser: argparse.ArgumentParser, args: argparse.Namespace
         parser.error("--pagenum-box is required when --stamp-page-numbers is enabled.")
     if args.stamp_page_numbers_force and not args.stamp_page_numbers:
         parser.error("--stamp-page-numbers-force requires --stamp-page-numbers.")
+    if args.workers < 1:
+        parser.error("--workers must be >= 1.")
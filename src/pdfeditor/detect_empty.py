@@ -2,126 +2,159 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-import copy
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 import hashlib
 from io import BytesIO
+import re
+import threading
 from typing import Any, Callable
 
 from pypdf import PdfReader
-from pypdf.generic import ArrayObject
+from pypdf.generic import ArrayObject, NullObject, RectangleObject
 
 from pdfeditor.models import JSONValue, PageDecision
 
-PAINT_OPERATORS = {
-    '"',
-    "'",
-    "B",
-    "B*",
-    "BI",
-    "Do",
-    "F",
-    "S",
-    "TJ",
-    "Tj",
-    "b",
-    "b*",
-    "f",
-    "f*",
-    "s",
-    "sh",
-}
+PAINT_OPERATORS = frozenset(
+    {
+        '"',
+        "'",
+        "B",
+        "B*",
+        "BI",
+        "Do",
+        "F",
+        "S",
+        "TJ",
+        "Tj",
+        "b",
+        "b*",
+        "f",
+        "f*",
+        "s",
+        "sh",
+    }
+)
+
+STATE_OPERATORS = frozenset(
+    {
+        "BT",
+        "CS",
+        "ET",
+        "G",
+        "J",
+        "K",
+        "M",
+        "Q",
+        "RG",
+        "SC",
+        "SCN",
+        "TD",
+        "TL",
+        "Tf",
+        "Tm",
+        "Tr",
+        "Ts",
+        "Tw",
+        "Tz",
+        "W",
+        "W*",
+        "c",
+        "cm",
+        "cs",
+        "d",
+        "g",
+        "gs",
+        "h",
+        "i",
+        "j",
+        "k",
+        "l",
+        "m",
+        "n",
+        "q",
+        "re",
+        "rg",
+        "ri",
+        "sc",
+        "scn",
+        "v",
+        "w",
+        "y",
+    }
+)
 
-STATE_OPERATORS = {
-    "BT",
-    "CS",
-    "ET",
-    "G",
-    "J",
-    "K",
-    "M",
-    "Q",
-    "RG",
-    "SC",
-    "SCN",
-    "TD",
-    "TL",
-    "Tf",
-    "Tm",
-    "Tr",
-    "Ts",
-    "Tw",
-    "Tz",
-    "W",
-    "W*",
-    "c",
-    "cm",
-    "cs",
-    "d",
-    "g",
-    "gs",
-    "h",
-    "i",
-    "j",
-    "k",
-    "l",
-    "m",
-    "n",
-    "q",
-    "re",
-    "rg",
-    "ri",
-    "sc",
-    "scn",
-    "v",
-    "w",
-    "y",
-}
+TEXT_SHOW_OPERATORS = frozenset({'"', "'", "TJ", "Tj"})
+PATH_PAINT_OPERATORS = frozenset({"B", "B*", "F", "S", "b", "b*", "f", "f*", "s", "sh"})
+
+# pypdf yields operators as bytes; the evaluation loop matches them without decoding.
+_STATE_OPERATOR_BYTES = frozenset(name.encode("latin-1") for name in STATE_OPERATORS)
 
-TEXT_SHOW_OPERATORS = {'"', "'", "TJ", "Tj"}
-PATH_PAINT_OPERATORS = {"B", "B*", "F", "S", "b", "b*", "f", "f*", "s", "sh"}
+_WHITESPACE_BYTES = bytes(byte for byte in range(256) if chr(byte).isspace())
+_COMMENT_OR_WHITESPACE_RUN_PATTERN = re.compile(
+    rb"(?:%[^\r\n]*|[" + re.escape(_WHITESPACE_BYTES) + rb"]+)*"
+)
 
 
 def detect_page_decisions(
     reader: PdfReader,
     treat_annotations_as_empty: bool,
     debug_sink: Callable[[dict[str, JSONValue]], None] | None = None,
+    max_workers: int | None = None,
 ) -> list[PageDecision]:
     """Return structured empty-page decisions for each page in a reader."""
-    decisions: list[PageDecision] = []
-    for page_index, page in enumerate(reader.pages):
-        is_empty, reason, details = is_page_empty_structural(
-            page,
+    if not reader.is_encrypted and _use_page_workers(max_workers, len(reader.pages)):
+        return _detect_page_decisions_parallel(
+            _reader_bytes(reader),
+            page_count=len(reader.pages),
             treat_annotations_as_empty=treat_annotations_as_empty,
-            page_index=page_index,
             debug_sink=debug_sink,
+            max_workers=max_workers,
         )
-        decisions.append(
-            PageDecision(
-                page_index=page_index,
-                is_empty=is_empty,
-                reason=reason,
-                details=details,
-            )
+    return [
+        _page_decision(
+            page,
+            page_index=page_index,
+            treat_annotations_as_empty=treat_annotations_as_empty,
+            debug_sink=debug_sink,
         )
-    return decisions
+        for page_index, page in enumerate(reader.pages)
+    ]
 
 
 def detect_empty_pages(
     pdf_bytes: bytes,
     treat_annotations_as_empty: bool = True,
+    max_workers: int | None = None,
+    use_cache: bool = False,
 ) -> Sequence[bool]:
-    """Return per-page empty-page decisions for a PDF payload."""
-    reader = PdfReader(BytesIO(pdf_bytes))
+    """Return per-page empty-page decisions for a PDF payload.
+
+    With ``use_cache=True`` the parsed reader is kept in a small per-thread LRU
+    keyed by a BLAKE2b digest of the payload, so repeated calls on the same
+    bytes skip re-parsing the xref and page tree.
+    """
+    reader = _cached_reader(pdf_bytes) if use_cache else PdfReader(BytesIO(pdf_bytes))
     if reader.is_encrypted:
         raise ValueError("Encrypted PDFs are not supported.")
-    return [
-        decision.is_empty
-        for decision in detect_page_decisions(
+    if _use_page_workers(max_workers, len(reader.pages)):
+        decisions = _detect_page_decisions_parallel(
+            pdf_bytes,
+            page_count=len(reader.pages),
+            treat_annotations_as_empty=treat_annotations_as_empty,
+            debug_sink=None,
+            max_workers=max_workers,
+            collect_details=False,
+        )
+        return [decision.is_empty for decision in decisions]
+    return list(
+        _iter_page_is_empty(
             reader,
             treat_annotations_as_empty=treat_annotations_as_empty,
         )
-    ]
+    )
 
 
 def is_page_empty_structural(
@@ -129,29 +162,53 @@ def is_page_empty_structural(
     treat_annotations_as_empty: bool,
     page_index: int | None = None,
     debug_sink: Callable[[dict[str, JSONValue]], None] | None = None,
+    collect_details: bool = True,
 ) -> tuple[bool, str, dict[str, JSONValue]]:
-    """Determine whether a page is structurally empty."""
+    """Determine whether a page is structurally empty.
+
+    The debug record (stream previews, hashes, operator summary) is only built
+    when a ``debug_sink`` is given. With ``collect_details=False`` only the
+    decision and reason are reliable: per-operator bookkeeping is skipped.
+    """
+    if not collect_details and debug_sink is None:
+        quick_decision = _quick_structural_decision(page, treat_annotations_as_empty)
+        if quick_decision is not None:
+            return quick_decision[0], quick_decision[1], {}
+
     details: dict[str, JSONValue] = {}
-    debug_record = _initialize_debug_record(page=page, page_index=page_index)
+    debug_record = (
+        _initialize_debug_record(page=page, page_index=page_index)
+        if debug_sink is not None
+        else None
+    )
     try:
-        resources = _resolve_dict(page.get("/Resources"))
-        xobject_present = _dict_has_entries(resources.get("/XObject"))
-        fonts_present = _dict_has_entries(resources.get("/Font"))
-        extgstates_count = _dict_count(resources.get("/ExtGState"))
+        resources = _resolve_dictionary(page.get("/Resources"))
+        if resources is None:
+            resources = {}
+        # Resolve each resource sub-dictionary once; counts come from len().
+        xobjects_count = _mapping_size(_resolve_dictionary(resources.get("/XObject")))
+        fonts_count = _mapping_size(_resolve_dictionary(resources.get("/Font")))
+        extgstates = _resolve_dictionary(resources.get("/ExtGState"))
+        extgstates_count = _mapping_size(extgstates)
+        xobject_present = xobjects_count > 0
+        fonts_present = fonts_count > 0
+        # Always counted: a malformed /Annots must make the page
+        # unknown_structure even when annotations are treated as empty.
         annotations_count = _count_entries(page.get("/Annots"))
         raw_contents = page.get("/Contents")
         has_contents = raw_contents is not None
-        debug_record.update(
-            {
-                "annotations_count": annotations_count,
-                "contents_object_type": _contents_object_type(raw_contents),
-                "extgstates_count": extgstates_count,
-                "fonts_count": _dict_count(resources.get("/Font")),
-                "has_contents": has_contents,
-                "resources_keys_present": _resource_keys(resources),
-                "xobjects_count": _dict_count(resources.get("/XObject")),
-            }
-        )
+        if debug_record is not None:
+            debug_record.update(
+                {
+                    "annotations_count": annotations_count,
+                    "contents_object_type": _contents_object_type(raw_contents),
+                    "extgstates_count": extgstates_count,
+                    "fonts_count": fonts_count,
+                    "has_contents": has_contents,
+                    "resources_keys_present": _resource_keys(resources),
+                    "xobjects_count": xobjects_count,
+                }
+            )
         details.update(
             {
                 "annotations_count": annotations_count,
@@ -173,7 +230,8 @@ def is_page_empty_structural(
                 "xobject_present": xobject_present,
             }
         )
-        _merge_content_stream_debug(page=page, debug_record=debug_record)
+        if debug_record is not None:
+            _merge_content_stream_debug(page=page, debug_record=debug_record)
 
         if xobject_present:
             return False, "has_xobject", details
@@ -194,26 +252,35 @@ def is_page_empty_structural(
             _append_debug_exception(debug_record, exc)
             raise
         details["contents_length_bytes"] = len(content_data)
-        debug_record["total_contents_bytes"] = len(content_data)
-
-        normalized_data = _strip_pdf_comments_and_whitespace(content_data)
-        if not normalized_data:
-            return True, "contents_whitespace_only", details
+        if debug_record is not None:
+            debug_record["total_contents_bytes"] = len(content_data)
 
         try:
-            operations = list(getattr(contents, "operations", []))
+            # pypdf parses the stream once and hands back its own list; only
+            # materialize other iterables, which are consumed twice below.
+            operations = getattr(contents, "operations", ())
+            if not isinstance(operations, list | tuple):
+                operations = list(operations)
         except Exception as exc:
+            if _is_comment_or_whitespace_only(content_data):
+                return True, "contents_whitespace_only", details
             _append_debug_exception(debug_record, exc)
             raise
-        debug_record["operator_summary"] = _build_operator_summary(operations)
-        if not operations and normalized_data:
+        if not operations:
+            if _is_comment_or_whitespace_only(content_data):
+                return True, "contents_whitespace_only", details
+            if debug_record is not None:
+                debug_record["operator_summary"] = _build_operator_summary(operations)
             return True, "no_paint_ops", details
+        if debug_record is not None:
+            debug_record["operator_summary"] = _build_operator_summary(operations)
 
         result = _evaluate_operations(
-            page=page,
             operations=operations,
             details=details,
+            extgstate_resources=_resolve_mapping(extgstates),
             debug_record=debug_record,
+            collect_details=collect_details,
         )
         if result is not None:
             return result
@@ -225,10 +292,186 @@ def is_page_empty_structural(
         details["error"] = str(exc)
         return False, "unknown_structure", details
     finally:
-        if debug_sink is not None:
+        if debug_sink is not None and debug_record is not None:
             debug_sink(_finalize_debug_record(debug_record))
 
 
+def _quick_structural_decision(
+    page: Any,
+    treat_annotations_as_empty: bool,
+) -> tuple[bool, str] | None:
+    # Settles the checks that precede content-stream decoding without building
+    # details. Anything unusual (including malformed resources) returns None so
+    # the instrumented path reaches, and reports, the same decision.
+    try:
+        resources = _resolve_dictionary(page.get("/Resources"))
+        if resources is not None:
+            _resolve_dictionary(resources.get("/Font"))
+            _resolve_dictionary(resources.get("/ExtGState"))
+            if _mapping_size(_resolve_dictionary(resources.get("/XObject"))) > 0:
+                return False, "has_xobject"
+        annotations_count = _count_entries(page.get("/Annots"))
+        if not treat_annotations_as_empty and annotations_count > 0:
+            return False, "has_annotations"
+    except Exception:
+        return None
+    if page.get("/Contents") is None:
+        return True, "no_contents"
+    return None
+
+
+def _iter_page_is_empty(reader: PdfReader, treat_annotations_as_empty: bool) -> Iterator[bool]:
+    for page in reader.pages:
+        is_empty, _, _ = is_page_empty_structural(
+            page,
+            treat_annotations_as_empty=treat_annotations_as_empty,
+            collect_details=False,
+        )
+        yield is_empty
+
+
+def _page_decision(
+    page: Any,
+    page_index: int,
+    treat_annotations_as_empty: bool,
+    debug_sink: Callable[[dict[str, JSONValue]], None] | None,
+    collect_details: bool = True,
+) -> PageDecision:
+    is_empty, reason, details = is_page_empty_structural(
+        page,
+        treat_annotations_as_empty=treat_annotations_as_empty,
+        page_index=page_index,
+        debug_sink=debug_sink,
+        collect_details=collect_details,
+    )
+    return PageDecision(
+        page_index=page_index,
+        is_empty=is_empty,
+        reason=reason,
+        details=details,
+    )
+
+
+def _reader_bytes(reader: PdfReader) -> bytes:
+    stream = reader.stream
+    getvalue = getattr(stream, "getvalue", None)
+    if callable(getvalue):
+        return getvalue()
+    position = stream.tell()
+    try:
+        stream.seek(0)
+        return stream.read()
+    finally:
+        stream.seek(position)
+
+
+# One reader cache per thread: a PdfReader seeks its shared stream while it
+# resolves objects, so a cached reader must never be used by two threads at once.
+_READER_CACHE_POOL = threading.local()
+_READER_CACHE_MAX = 8
+
+
+def _reader_cache() -> OrderedDict[bytes, PdfReader]:
+    cache = getattr(_READER_CACHE_POOL, "cache", None)
+    if cache is None:
+        cache = _READER_CACHE_POOL.cache = OrderedDict()
+    return cache
+
+
+def _cached_reader(pdf_bytes: bytes) -> PdfReader:
+    cache = _reader_cache()
+    key = hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+    reader = cache.get(key)
+    if reader is not None:
+        cache.move_to_end(key)
+        return reader
+    reader = PdfReader(BytesIO(pdf_bytes))
+    if not reader.is_encrypted:
+        cache[key] = reader
+        while len(cache) > _READER_CACHE_MAX:
+            cache.popitem(last=False)
+    return reader
+
+
+# Below this many pages, worker start-up and per-worker PDF parsing outweigh
+# any gain from spreading pages across processes.
+_PARALLEL_MIN_PAGES = 4
+
+
+def _use_page_workers(max_workers: int | None, page_count: int) -> bool:
+    return max_workers is not None and max_workers > 1 and page_count >= _PARALLEL_MIN_PAGES
+
+
+_PAGE_WORKER_READER: PdfReader | None = None
+_PAGE_WORKER_TREAT_ANNOTATIONS_AS_EMPTY = True
+_PAGE_WORKER_COLLECT_DEBUG = False
+_PAGE_WORKER_COLLECT_DETAILS = True
+
+
+def _detect_page_decisions_parallel(
+    pdf_bytes: bytes,
+    page_count: int,
+    treat_annotations_as_empty: bool,
+    debug_sink: Callable[[dict[str, JSONValue]], None] | None,
+    max_workers: int,
+    collect_details: bool = True,
+) -> list[PageDecision]:
+    chunk_size = max(1, page_count // (4 * max_workers))
+    page_ranges = [
+        (start, min(start + chunk_size, page_count))
+        for start in range(0, page_count, chunk_size)
+    ]
+    decisions: list[PageDecision] = []
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(page_ranges)),
+        initializer=_init_page_worker,
+        initargs=(pdf_bytes, treat_annotations_as_empty, debug_sink is not None, collect_details),
+    ) as executor:
+        # map() yields chunks in submission order, so decisions and debug
+        # records keep page order regardless of which worker finishes first.
+        for chunk_decisions, chunk_records in executor.map(_detect_page_range, page_ranges):
+            decisions.extend(chunk_decisions)
+            if debug_sink is not None:
+                for record in chunk_records:
+                    debug_sink(record)
+    return decisions
+
+
+def _init_page_worker(
+    pdf_bytes: bytes,
+    treat_annotations_as_empty: bool,
+    collect_debug: bool,
+    collect_details: bool,
+) -> None:
+    global _PAGE_WORKER_READER, _PAGE_WORKER_TREAT_ANNOTATIONS_AS_EMPTY
+    global _PAGE_WORKER_COLLECT_DEBUG, _PAGE_WORKER_COLLECT_DETAILS
+    _PAGE_WORKER_READER = PdfReader(BytesIO(pdf_bytes))
+    _PAGE_WORKER_TREAT_ANNOTATIONS_AS_EMPTY = treat_annotations_as_empty
+    _PAGE_WORKER_COLLECT_DEBUG = collect_debug
+    _PAGE_WORKER_COLLECT_DETAILS = collect_details
+
+
+def _detect_page_range(
+    page_range: tuple[int, int],
+) -> tuple[list[PageDecision], list[dict[str, JSONValue]]]:
+    if _PAGE_WORKER_READER is None:
+        raise RuntimeError("Page worker was not initialized.")
+    records: list[dict[str, JSONValue]] = []
+    debug_sink = records.append if _PAGE_WORKER_COLLECT_DEBUG else None
+    pages = _PAGE_WORKER_READER.pages
+    decisions = [
+        _page_decision(
+            pages[page_index],
+            page_index=page_index,
+            treat_annotations_as_empty=_PAGE_WORKER_TREAT_ANNOTATIONS_AS_EMPTY,
+            debug_sink=debug_sink,
+            collect_details=_PAGE_WORKER_COLLECT_DETAILS,
+        )
+        for page_index in range(*page_range)
+    ]
+    return decisions, records
+
+
 def _resolve_object(value: Any) -> Any:
     if value is None:
         return None
@@ -238,22 +481,22 @@ def _resolve_object(value: Any) -> Any:
     return value
 
 
-def _resolve_dict(value: Any) -> dict[str, Any]:
+def _resolve_mapping(value: Any) -> Any:
     resolved = _resolve_object(value)
     if resolved is None:
         return {}
-    if not hasattr(resolved, "items"):
+    if not hasattr(resolved, "get"):
         raise TypeError("Expected a PDF dictionary object.")
-    return {str(key): item for key, item in resolved.items()}
+    return resolved
 
 
-def _dict_has_entries(value: Any) -> bool:
+def _resolve_dictionary(value: Any) -> Any:
     resolved = _resolve_object(value)
     if resolved is None:
-        return False
+        return None
     if not hasattr(resolved, "items"):
         raise TypeError("Expected a PDF dictionary object.")
-    return len(list(resolved.items())) > 0
+    return resolved
 
 
 def _count_entries(value: Any) -> int:
@@ -265,138 +508,308 @@ def _count_entries(value: Any) -> int:
     raise TypeError("Expected a PDF array-like object.")
 
 
-def _dict_count(value: Any) -> int:
-    resolved = _resolve_object(value)
+def _mapping_size(resolved: Any) -> int:
     if resolved is None:
         return 0
-    if not hasattr(resolved, "items"):
-        raise TypeError("Expected a PDF dictionary object.")
-    return len(list(resolved.items()))
-
-
-def _strip_pdf_comments_and_whitespace(content: bytes) -> bytes:
-    output = bytearray()
-    in_comment = False
-    for byte in content:
-        if in_comment:
-            if byte in (10, 13):
-                in_comment = False
-            continue
-        if byte == 37:
-            in_comment = True
-            continue
-        if chr(byte).isspace():
-            continue
-        output.append(byte)
-    return bytes(output)
+    if hasattr(resolved, "__len__"):
+        return len(resolved)
+    return sum(1 for _ in resolved.items())
+
+
+def _is_comment_or_whitespace_only(content: bytes) -> bool:
+    if b"%" not in content:
+        # Comment-free streams (the common case) need no regex: memchr finds
+        # "%" and strip() stops at the first non-whitespace byte.
+        return not content.strip(_WHITESPACE_BYTES)
+    return _COMMENT_OR_WHITESPACE_RUN_PATTERN.match(content).end() == len(content)
+
+
+OperationResult = tuple[bool, str, dict[str, JSONValue]] | None
+# (note, fill_opacity, stroke_opacity) resolved once per ExtGState name and page.
+_ExtGStateOpacities = tuple[str | None, float | None, float | None]
+
+
+@dataclass(slots=True)
+class _VisibilityState:
+    fill_opacity: float = 1.0
+    stroke_opacity: float = 1.0
+    text_rendering_mode: int = 0
+    font_size: float | None = None
+    extgstate_name: str | None = None
+
+    def copy(self) -> _VisibilityState:
+        return _VisibilityState(
+            self.fill_opacity,
+            self.stroke_opacity,
+            self.text_rendering_mode,
+            self.font_size,
+            self.extgstate_name,
+        )
+
+    def reset(self) -> None:
+        self.fill_opacity = 1.0
+        self.stroke_opacity = 1.0
+        self.text_rendering_mode = 0
+        self.font_size = None
+        self.extgstate_name = None
+
+
+@dataclass(slots=True)
+class _EvaluationContext:
+    details: dict[str, JSONValue]
+    extgstate_resources: Any
+    debug_record: dict[str, JSONValue] | None
+    state: _VisibilityState
+    stack: list[_VisibilityState]
+    paint_ops_seen_count: int = 0
+    invisible_text_events_count: int = 0
+    invisible_path_events_count: int = 0
+    extgstate_cache: dict[str, _ExtGStateOpacities] = field(default_factory=dict)
+
+    def reset(
+        self,
+        details: dict[str, JSONValue],
+        extgstate_resources: Any,
+        debug_record: dict[str, JSONValue] | None,
+    ) -> None:
+        self.details = details
+        self.extgstate_resources = extgstate_resources
+        self.debug_record = debug_record
+        self.state.reset()
+        self.paint_ops_seen_count = 0
+        self.invisible_text_events_count = 0
+        self.invisible_path_events_count = 0
+
+    def release(self) -> None:
+        # Drop page-owned references so a pooled context does not pin a reader.
+        self.extgstate_resources = None
+        self.debug_record = None
+        self.stack.clear()
+        self.extgstate_cache.clear()
+
+
+# One reusable evaluation context per thread; a context is taken out of the
+# pool while in use, so nested or concurrent evaluations never share one.
+_CONTEXT_POOL = threading.local()
 
 
 def _evaluate_operations(
-    page: Any,
-    operations: list[tuple[Any, Any]],
+    operations: Iterable[tuple[Any, Any]],
     details: dict[str, JSONValue],
+    extgstate_resources: Any,
     debug_record: dict[str, JSONValue] | None = None,
-) -> tuple[bool, str, dict[str, JSONValue]] | None:
-    resources = _resolve_dict(page.get("/Resources"))
-    extgstate_resources = _resolve_dict(resources.get("/ExtGState"))
-    state = _default_visibility_state()
-    stack: list[dict[str, JSONValue]] = []
+    collect_details: bool = True,
+) -> OperationResult:
+    context = getattr(_CONTEXT_POOL, "context", None)
+    if context is None:
+        context = _EvaluationContext(
+            details=details,
+            extgstate_resources=extgstate_resources,
+            debug_record=debug_record,
+            state=_VisibilityState(),
+            stack=[],
+        )
+    else:
+        _CONTEXT_POOL.context = None
+        context.reset(details, extgstate_resources, debug_record)
 
-    for operands, operator in operations:
-        operator_name = _operator_name(operator)
-        if operator_name == "INLINE IMAGE":
-            _record_paint_op(details, "BI")
-            details["visible_mark_found"] = True
-            return False, "inline_image", details
-
-        if operator_name in STATE_OPERATORS:
-            _record_state_op(details, operator_name)
-
-        if operator_name == "q":
-            stack.append(copy.deepcopy(state))
-            continue
-        if operator_name == "Q":
-            if stack:
-                state = stack.pop()
-            else:
-                _append_limited(details["notes"], "graphics_state_underflow")
-            _sync_last_seen(details, state)
-            continue
-        if operator_name == "Tr":
-            state["text_rendering_mode"] = _to_int(_operand_at(operands, 0), default=state["text_rendering_mode"])
-            _record_operator_event(debug_record, "tr_events", {"operator": "Tr", "value": int(state["text_rendering_mode"])})
-            _sync_last_seen(details, state)
-            continue
-        if operator_name == "Tf":
-            state["font_size"] = _to_float(_operand_at(operands, 1))
-            _record_operator_event(
-                debug_record,
-                "tf_events",
-                {
-                    "operator": "Tf",
-                    "font": _name_value(_operand_at(operands, 0)),
-                    "size": float(state["font_size"]) if state["font_size"] is not None else None,
-                },
-            )
-            _sync_last_seen(details, state)
-            continue
-        if operator_name == "gs":
-            extgstate_name = _name_value(_operand_at(operands, 0))
-            if extgstate_name is not None:
-                _append_limited(details["extgstate_hits"], extgstate_name)
-                state["extgstate_name"] = extgstate_name
-                _apply_extgstate(state, extgstate_resources.get(extgstate_name), details)
-                _record_operator_event(
-                    debug_record,
-                    "gs_events",
-                    {
-                        "operator": "gs",
-                        "name": extgstate_name,
-                        "ca": float(state["fill_opacity"]),
-                        "CA": float(state["stroke_opacity"]),
-                    },
-                )
-            else:
-                _append_limited(details["notes"], "gs_without_name")
-            _sync_last_seen(details, state)
-            continue
-        if operator_name in TEXT_SHOW_OPERATORS:
-            _record_paint_op(details, operator_name)
-            if _text_is_visible(state):
-                details["visible_mark_found"] = True
-                _sync_last_seen(details, state)
-                return False, "visible_text", details
-            details["invisible_text_events_count"] = int(details["invisible_text_events_count"]) + 1
-            _sync_last_seen(details, state)
-            continue
-        if operator_name == "Do":
-            _record_paint_op(details, operator_name)
-            details["visible_mark_found"] = True
-            _sync_last_seen(details, state)
-            return False, "xobject_paint", details
-        if operator_name in PATH_PAINT_OPERATORS:
-            _record_paint_op(details, operator_name)
-            if _opacity_visible(state):
-                details["visible_mark_found"] = True
-                _sync_last_seen(details, state)
-                return False, "visible_path_paint", details
-            details["invisible_path_events_count"] = int(details["invisible_path_events_count"]) + 1
-            _sync_last_seen(details, state)
-            continue
-
-        _sync_last_seen(details, state)
+    # Bind hot-loop lookups to locals; this loop runs once per content-stream operator.
+    operator_bytes_of = _operator_bytes
+    state_ops_found = details["state_ops_found"]
+    get_dispatch = _OPERATOR_DISPATCH.get
+
+    try:
+        for operands, operator in operations:
+            if operator.__class__ is not bytes:
+                operator = operator_bytes_of(operator)
+            # One lookup classifies the operator; unknown operators fall through.
+            dispatch = get_dispatch(operator)
+            if dispatch is not None:
+                is_state_operator, handler = dispatch
+                if is_state_operator and collect_details and len(state_ops_found) < 10:
+                    state_ops_found.append(operator.decode("latin-1"))
+                if handler is not None:
+                    result = handler(context, operator, operands)
+                    if result is not None:
+                        return result
+    finally:
+        # last_seen_* reflects the state at whichever operator ended the scan,
+        # so it only needs writing once, on the way out.
+        if collect_details:
+            _sync_last_seen(details, context.state)
+        _flush_event_counts(context)
+        context.release()
+        _CONTEXT_POOL.context = context
 
     return None
 
 
-def _default_visibility_state() -> dict[str, JSONValue]:
-    return {
-        "fill_opacity": 1.0,
-        "font_size": None,
-        "stroke_opacity": 1.0,
-        "text_rendering_mode": 0,
-        "extgstate_name": None,
-    }
+def _flush_event_counts(context: _EvaluationContext) -> None:
+    details = context.details
+    details["paint_ops_seen_count"] = context.paint_ops_seen_count
+    details["invisible_text_events_count"] = context.invisible_text_events_count
+    details["invisible_path_events_count"] = context.invisible_path_events_count
+
+
+def _handle_inline_image(
+    context: _EvaluationContext,
+    operator: bytes,
+    operands: Any,
+) -> OperationResult:
+    _record_paint_op(context, b"BI")
+    context.details["visible_mark_found"] = True
+    return False, "inline_image", context.details
+
+
+def _handle_save_state(
+    context: _EvaluationContext,
+    operator: bytes,
+    operands: Any,
+) -> OperationResult:
+    context.stack.append(context.state.copy())
+    return None
+
+
+def _handle_restore_state(
+    context: _EvaluationContext,
+    operator: bytes,
+    operands: Any,
+) -> OperationResult:
+    if context.stack:
+        context.state = context.stack.pop()
+    else:
+        _append_limited(context.details["notes"], "graphics_state_underflow")
+    return None
+
+
+def _handle_text_rendering_mode(
+    context: _EvaluationContext,
+    operator: bytes,
+    operands: Any,
+) -> OperationResult:
+    state = context.state
+    state.text_rendering_mode = _to_int(_operand_at(operands, 0), default=state.text_rendering_mode)
+    if context.debug_record is not None:
+        _record_operator_event(
+            context.debug_record,
+            "tr_events",
+            {"operator": "Tr", "value": state.text_rendering_mode},
+        )
+    return None
+
+
+def _handle_text_font(
+    context: _EvaluationContext,
+    operator: bytes,
+    operands: Any,
+) -> OperationResult:
+    state = context.state
+    state.font_size = _to_float(_operand_at(operands, 1))
+    if context.debug_record is not None:
+        _record_operator_event(
+            context.debug_record,
+            "tf_events",
+            {
+                "operator": "Tf",
+                "font": _name_value(_operand_at(operands, 0)),
+                "size": state.font_size,
+            },
+        )
+    return None
+
+
+def _handle_extgstate(
+    context: _EvaluationContext,
+    operator: bytes,
+    operands: Any,
+) -> OperationResult:
+    state = context.state
+    extgstate_name = _name_value(_operand_at(operands, 0))
+    if extgstate_name is None:
+        _append_limited(context.details["notes"], "gs_without_name")
+        return None
+    extgstate_hits = context.details["extgstate_hits"]
+    if len(extgstate_hits) < 10:
+        extgstate_hits.append(extgstate_name)
+    state.extgstate_name = extgstate_name
+    opacities = context.extgstate_cache.get(extgstate_name)
+    if opacities is None:
+        opacities = _extgstate_opacities(context.extgstate_resources.get(extgstate_name))
+        context.extgstate_cache[extgstate_name] = opacities
+    _apply_extgstate(state, opacities, context.details)
+    if context.debug_record is not None:
+        _record_operator_event(
+            context.debug_record,
+            "gs_events",
+            {
+                "operator": "gs",
+                "name": extgstate_name,
+                "ca": state.fill_opacity,
+                "CA": state.stroke_opacity,
+            },
+        )
+    return None
+
+
+def _handle_text_show(
+    context: _EvaluationContext,
+    operator: bytes,
+    operands: Any,
+) -> OperationResult:
+    details = context.details
+    _record_paint_op(context, operator)
+    if _text_is_visible(context.state):
+        details["visible_mark_found"] = True
+        return False, "visible_text", details
+    context.invisible_text_events_count += 1
+    return None
+
+
+def _handle_xobject_paint(
+    context: _EvaluationContext,
+    operator: bytes,
+    operands: Any,
+) -> OperationResult:
+    _record_paint_op(context, operator)
+    context.details["visible_mark_found"] = True
+    return False, "xobject_paint", context.details
+
+
+def _handle_path_paint(
+    context: _EvaluationContext,
+    operator: bytes,
+    operands: Any,
+) -> OperationResult:
+    details = context.details
+    _record_paint_op(context, operator)
+    if _opacity_visible(context.state):
+        details["visible_mark_found"] = True
+        return False, "visible_path_paint", details
+    context.invisible_path_events_count += 1
+    return None
+
+
+_OPERATOR_HANDLERS: dict[bytes, Callable[[_EvaluationContext, bytes, Any], OperationResult]] = {
+    b"INLINE IMAGE": _handle_inline_image,
+    b"q": _handle_save_state,
+    b"Q": _handle_restore_state,
+    b"Tr": _handle_text_rendering_mode,
+    b"Tf": _handle_text_font,
+    b"gs": _handle_extgstate,
+    b"Do": _handle_xobject_paint,
+    **{name.encode("latin-1"): _handle_text_show for name in TEXT_SHOW_OPERATORS},
+    **{name.encode("latin-1"): _handle_path_paint for name in PATH_PAINT_OPERATORS},
+}
+
+# operator -> (recorded in state_ops_found, handler or None), covering every
+# operator the evaluation loop cares about.
+_OPERATOR_DISPATCH: dict[
+    bytes,
+    tuple[bool, Callable[[_EvaluationContext, bytes, Any], OperationResult] | None],
+] = {
+    operator: (operator in _STATE_OPERATOR_BYTES, _OPERATOR_HANDLERS.get(operator))
+    for operator in _STATE_OPERATOR_BYTES | _OPERATOR_HANDLERS.keys()
+}
 
 
 def _operator_name(operator: Any) -> str:
@@ -405,6 +818,12 @@ def _operator_name(operator: Any) -> str:
     return str(operator)
 
 
+def _operator_bytes(operator: Any) -> bytes:
+    if isinstance(operator, bytes):
+        return bytes(operator)
+    return str(operator).encode("latin-1", errors="replace")
+
+
 def _operand_at(operands: Any, index: int) -> Any:
     if not isinstance(operands, list):
         return None
@@ -413,49 +832,47 @@ def _operand_at(operands: Any, index: int) -> Any:
     return operands[index]
 
 
-def _apply_extgstate(
-    state: dict[str, JSONValue],
-    extgstate_value: Any,
-    details: dict[str, JSONValue],
-) -> None:
+def _extgstate_opacities(extgstate_value: Any) -> _ExtGStateOpacities:
     resolved = _resolve_object(extgstate_value)
     if resolved is None:
-        _append_limited(details["notes"], "unknown_extgstate")
-        return
+        return "unknown_extgstate", None, None
     if not hasattr(resolved, "get"):
-        _append_limited(details["notes"], "invalid_extgstate")
-        return
+        return "invalid_extgstate", None, None
+    return None, _to_float(resolved.get("/ca")), _to_float(resolved.get("/CA"))
+
 
-    fill_opacity = _to_float(resolved.get("/ca"))
-    stroke_opacity = _to_float(resolved.get("/CA"))
+def _apply_extgstate(
+    state: _VisibilityState,
+    opacities: _ExtGStateOpacities,
+    details: dict[str, JSONValue],
+) -> None:
+    note, fill_opacity, stroke_opacity = opacities
+    if note is not None:
+        _append_limited(details["notes"], note)
+        return
     if fill_opacity is not None:
-        state["fill_opacity"] = fill_opacity
+        state.fill_opacity = fill_opacity
     if stroke_opacity is not None:
-        state["stroke_opacity"] = stroke_opacity
+        state.stroke_opacity = stroke_opacity
 
 
-def _text_is_visible(state: dict[str, JSONValue]) -> bool:
-    if state["text_rendering_mode"] == 3:
+def _text_is_visible(state: _VisibilityState) -> bool:
+    if state.text_rendering_mode == 3:
         return False
-    font_size = state["font_size"]
-    if isinstance(font_size, float | int) and float(font_size) == 0:
+    if state.font_size == 0:
         return False
     return _opacity_visible(state)
 
 
-def _opacity_visible(state: dict[str, JSONValue]) -> bool:
-    fill_opacity = float(state["fill_opacity"])
-    stroke_opacity = float(state["stroke_opacity"])
-    return fill_opacity > 0 or stroke_opacity > 0
+def _opacity_visible(state: _VisibilityState) -> bool:
+    return state.fill_opacity > 0 or state.stroke_opacity > 0
 
 
-def _record_paint_op(details: dict[str, JSONValue], operator_name: str) -> None:
-    details["paint_ops_seen_count"] = int(details["paint_ops_seen_count"]) + 1
-    _append_limited(details["paint_ops_found"], operator_name)
-
-
-def _record_state_op(details: dict[str, JSONValue], operator_name: str) -> None:
-    _append_limited(details["state_ops_found"], operator_name)
+def _record_paint_op(context: _EvaluationContext, operator: bytes) -> None:
+    context.paint_ops_seen_count += 1
+    paint_ops_found = context.details["paint_ops_found"]
+    if len(paint_ops_found) < 10:
+        paint_ops_found.append(operator.decode("latin-1"))
 
 
 def _append_limited(target: JSONValue, value: str, limit: int = 10) -> None:
@@ -466,13 +883,11 @@ def _append_limited(target: JSONValue, value: str, limit: int = 10) -> None:
     target.append(value)
 
 
-def _sync_last_seen(details: dict[str, JSONValue], state: dict[str, JSONValue]) -> None:
-    details["last_seen_Tr"] = int(state["text_rendering_mode"])
-    details["last_seen_font_size"] = (
-        float(state["font_size"]) if state["font_size"] is not None else None
-    )
-    details["last_seen_ca"] = float(state["fill_opacity"])
-    details["last_seen_CA"] = float(state["stroke_opacity"])
+def _sync_last_seen(details: dict[str, JSONValue], state: _VisibilityState) -> None:
+    details["last_seen_Tr"] = state.text_rendering_mode
+    details["last_seen_font_size"] = state.font_size
+    details["last_seen_ca"] = state.fill_opacity
+    details["last_seen_CA"] = state.stroke_opacity
 
 
 def _name_value(value: Any) -> str | None:
@@ -482,6 +897,10 @@ def _name_value(value: Any) -> str | None:
 
 
 def _to_float(value: Any, default: float | None = None) -> float | None:
+    # pypdf's FloatObject/NumberObject subclass float/int, so numeric operands
+    # convert directly without entering the try block.
+    if isinstance(value, float | int):
+        return float(value)
     if value is None:
         return default
     try:
@@ -491,6 +910,8 @@ def _to_float(value: Any, default: float | None = None) -> float | None:
 
 
 def _to_int(value: Any, default: int = 0) -> int:
+    if isinstance(value, int):
+        return int(value)
     if value is None:
         return default
     try:
@@ -504,11 +925,11 @@ def _initialize_debug_record(page: Any, page_index: int | None) -> dict[str, JSO
         "annotations_count": 0,
         "contents_object_type": "none",
         "content_streams": [],
-        "crop_box": _box_to_dict(getattr(page, "cropbox", None)),
+        "crop_box": _page_box_to_dict(page, "/CropBox", fallback="/MediaBox"),
         "extgstates_count": 0,
         "fonts_count": 0,
         "has_contents": False,
-        "media_box": _box_to_dict(getattr(page, "mediabox", None)),
+        "media_box": _page_box_to_dict(page, "/MediaBox"),
         "number_of_content_streams": 0,
         "operator_summary": {
             "gs_events": [],
@@ -534,6 +955,23 @@ def _finalize_debug_record(debug_record: dict[str, JSONValue]) -> dict[str, JSON
     return debug_record
 
 
+def _page_box_to_dict(page: Any, name: str, fallback: str | None = None) -> dict[str, JSONValue] | None:
+    # Read the box from the page dictionary rather than through pypdf's
+    # cropbox/mediabox properties: those write the resolved box back into the
+    # page, and the rewrite reuses these page objects, so a debug flag would
+    # otherwise change the output PDF.
+    box = _resolve_object(page.get(name))
+    if (box is None or isinstance(box, NullObject)) and fallback is not None:
+        box = _resolve_object(page.get(fallback))
+    if box is None or isinstance(box, NullObject):
+        return None
+    try:
+        box = RectangleObject(box)
+    except Exception:
+        return {"repr": str(box)}
+    return _box_to_dict(box)
+
+
 def _box_to_dict(box: Any) -> dict[str, JSONValue] | None:
     if box is None:
         return None
@@ -574,20 +1012,22 @@ def _merge_content_stream_debug(page: Any, debug_record: dict[str, JSONValue]) -
 
     for stream_index, stream_object in enumerate(stream_objects):
         try:
-            decoded = bytes(stream_object.get_data())
+            decoded = stream_object.get_data()
+            if not isinstance(decoded, bytes):
+                decoded = bytes(decoded)
             total_bytes += len(decoded)
             if stream_index < 3:
+                view = memoryview(decoded)
                 previews.append(
                     {
                         "stream_index": stream_index,
                         "decoded_length_bytes": len(decoded),
-                        "first_200_bytes": _safe_preview(decoded[:200]),
-                        "last_200_bytes": _safe_preview(decoded[-200:]),
+                        "first_200_bytes": _safe_preview(view[:200]),
+                        "last_200_bytes": _safe_preview(view[-200:]),
                         "sha256": hashlib.sha256(decoded).hexdigest(),
                     }
                 )
         except Exception as exc:
-            total_bytes += 0
             _append_limited(exceptions, _exception_text(exc), limit=10)
             if stream_index < 3:
                 previews.append(
@@ -611,25 +1051,30 @@ def _content_stream_objects(contents: Any) -> list[Any]:
     return [resolved]
 
 
-def _safe_preview(content: bytes) -> str:
-    return repr(content.decode("latin-1", errors="replace"))[1:-1]
+def _safe_preview(content: bytes | memoryview) -> str:
+    return repr(str(content, "latin-1", errors="replace"))[1:-1]
 
 
-def _build_operator_summary(operations: list[tuple[Any, Any]]) -> dict[str, JSONValue]:
-    counts: dict[str, int] = {}
+def _build_operator_summary(operations: Sequence[tuple[Any, Any]]) -> dict[str, JSONValue]:
+    # Count by the raw operator and decode each distinct operator once.
+    operator_counts: dict[Any, int] = {}
     paint_ops_seen: list[str] = []
     text_show_ops_seen: list[str] = []
-    xobject_paint_seen = False
 
     for _, operator in operations:
+        operator_counts[operator] = operator_counts.get(operator, 0) + 1
+        if len(paint_ops_seen) < 15 or len(text_show_ops_seen) < 15:
+            operator_name = _operator_name(operator)
+            if operator_name in PAINT_OPERATORS:
+                _append_limited(paint_ops_seen, operator_name, limit=15)
+            if operator_name in TEXT_SHOW_OPERATORS:
+                _append_limited(text_show_ops_seen, operator_name, limit=15)
+
+    counts: dict[str, int] = {}
+    for operator, count in operator_counts.items():
         operator_name = _operator_name(operator)
-        counts[operator_name] = counts.get(operator_name, 0) + 1
-        if operator_name in PAINT_OPERATORS:
-            _append_limited(paint_ops_seen, operator_name, limit=15)
-        if operator_name in TEXT_SHOW_OPERATORS:
-            _append_limited(text_show_ops_seen, operator_name, limit=15)
-        if operator_name == "Do":
-            xobject_paint_seen = True
+        counts[operator_name] = counts.get(operator_name, 0) + count
+    xobject_paint_seen = "Do" in counts
 
     top_operators = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:15]
     return {
@@ -658,7 +1103,7 @@ def _operator_summary(debug_record: dict[str, JSONValue] | None) -> dict[str, JS
 
 
 def _record_operator_event(
-    debug_record: dict[str, JSONValue] | None,
+    debug_record: dict[str, JSONValue],
     key: str,
     event: dict[str, JSONValue],
 ) -> None:
@@ -669,7 +1114,9 @@ def _record_operator_event(
     target.append(event)
 
 
-def _append_debug_exception(debug_record: dict[str, JSONValue], exc: Exception) -> None:
+def _append_debug_exception(debug_record: dict[str, JSONValue] | None, exc: Exception) -> None:
+    if debug_record is None:
+        return
     summary = _operator_summary(debug_record)
     target = summary.get("parsing_exceptions")
     if not isinstance(target, list):
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import ctypes
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import Any, Callable
@@ -9,20 +14,16 @@ from typing import Any, Callable
 from pdfeditor.models import JSONValue, PageDecision
 
 
+@lru_cache(maxsize=1)
 def is_render_backend_available() -> bool:
-    """Return whether pypdfium2 is importable."""
-    try:
-        import_module("pypdfium2")
-    except ModuleNotFoundError:
-        return False
-    return True
+    """Return whether pypdfium2 is importable, probing at most once per process."""
+    return _load_pdfium() is not None
 
 
 def get_render_backend_version() -> str | None:
     """Return the installed pypdfium2 version string if available."""
-    try:
-        pdfium = import_module("pypdfium2")
-    except ModuleNotFoundError:
+    pdfium = _load_pdfium()
+    if pdfium is None:
         return None
     version_module = getattr(pdfium, "version", None)
     if version_module is None:
@@ -30,6 +31,16 @@ def get_render_backend_version() -> str | None:
     return getattr(version_module, "PYPDFIUM_INFO", None)
 
 
+@lru_cache(maxsize=1)
+def _load_pdfium() -> Any:
+    # Imported lazily so the CLI starts without PDFium; the module, or None when
+    # it is missing, is resolved once per process.
+    try:
+        return import_module("pypdfium2")
+    except ModuleNotFoundError:
+        return None
+
+
 def detect_empty_pages_render(
     input_path: Path,
     dpi: int,
@@ -38,111 +49,403 @@ def detect_empty_pages_render(
     sample_margin_inches: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0),
     white_threshold: int = 240,
     debug_sink: Callable[[dict[str, JSONValue]], None] | None = None,
-) -> list[PageDecision]:
-    """Render each page and classify it by ink ratio against a white background."""
-    try:
-        pdfium = import_module("pypdfium2")
-    except ModuleNotFoundError as exc:
-        raise ModuleNotFoundError(
-            "Rendering mode requires optional dependency 'pypdfium2'."
-        ) from exc
-
-    effective_background = "white"
-    document = pdfium.PdfDocument(str(input_path))
-    decisions: list[PageDecision] = []
-    scale = dpi / 72.0
+    max_workers: int | None = None,
+    candidate_pages: Iterable[int] | None = None,
+    screening_dpi: int | None = None,
+    sample_step: int = 1,
+    decision_sink: Callable[[PageDecision], None] | None = None,
+    source: bytes | None = None,
+) -> list[PageDecision] | None:
+    """Render each page and classify it by ink ratio against a white background.
 
+    With ``max_workers`` greater than one, documents of at least
+    ``_PARALLEL_MIN_PAGES`` pages are split into page ranges rendered by worker
+    processes, each opening its own PDFium document. Decisions and debug records
+    keep page order either way.
+
+    ``candidate_pages`` limits rendering to the given 0-based page indices, for
+    callers that already settled the other pages with the structural detector.
+    Pages outside it are not rendered and get a non-empty
+    ``skipped_by_prefilter`` decision.
+
+    ``screening_dpi`` enables a cheaper first render at that resolution. Pages
+    whose screening ink ratio is more than twice ``ink_threshold`` are decided
+    non-empty from it; all others are re-rendered at ``dpi`` before deciding.
+
+    ``sample_step`` greater than one measures only every Nth pixel of every Nth
+    row, cutting the scan by roughly ``sample_step**2``. Marks thinner than the
+    step can fall between samples, so the default of ``1`` scans every pixel.
+
+    With ``decision_sink`` each decision is handed to the sink in page order as
+    soon as it is made and ``None`` is returned, so long documents never hold
+    the full decision list in memory.
+
+    ``source`` is the file's content when the caller has already read it
+    (pypdf loads the whole file anyway); PDFium then parses it from memory
+    instead of reading ``input_path`` again. Parallel workers still open
+    ``input_path`` themselves.
+    """
+    if sample_step < 1:
+        raise ValueError("sample_step must be >= 1.")
+    pdfium = _load_pdfium()
+    if pdfium is None:
+        raise ModuleNotFoundError("Rendering mode requires optional dependency 'pypdfium2'.")
+
+    settings = _RenderSettings(
+        dpi=dpi,
+        ink_threshold=ink_threshold,
+        background="white",
+        sample_margin_inches=sample_margin_inches,
+        white_threshold=white_threshold,
+        candidate_pages=frozenset(candidate_pages) if candidate_pages is not None else None,
+        screening_dpi=screening_dpi,
+        sample_step=sample_step,
+    )
+    decisions: list[PageDecision] = []
+    emit = decision_sink if decision_sink is not None else decisions.append
+    document = pdfium.PdfDocument(source if source is not None else str(input_path))
     try:
-        for page_index in range(len(document)):
-            page = document[page_index]
-            bitmap = None
-            try:
-                bitmap = page.render(scale=scale)
-                diagnostics = _measure_ink_ratio(
-                    bitmap=bitmap,
-                    background=effective_background,
-                    dpi=dpi,
-                    sample_margin_inches=sample_margin_inches,
-                    white_threshold=white_threshold,
+        page_count = len(document)
+        if not _use_page_workers(max_workers, page_count):
+            bitmap_maker = _ReusableBitmapMaker(pdfium)
+            for page_index in range(page_count):
+                decision, record = _page_decision(
+                    document,
+                    page_index=page_index,
+                    settings=settings,
+                    bitmap_maker=bitmap_maker,
+                    collect_debug=debug_sink is not None,
                 )
-                pixel_count = int(diagnostics["sampled_pixel_count"])
-                ink_ratio = float(diagnostics["ink_ratio"])
-                invalid_sample_area = bool(diagnostics["invalid_sample_area"])
-                is_empty = (ink_ratio < ink_threshold) if not invalid_sample_area else False
-                reason = (
-                    "invalid_sample_area"
-                    if invalid_sample_area
-                    else "ink_below_threshold" if is_empty else "ink_above_threshold"
-                )
-                if debug_sink is not None:
-                    debug_sink(
-                        {
-                            "page_index_0": page_index,
-                            "page_index_1": page_index + 1,
-                            "ink_ratio": ink_ratio,
-                            "is_empty_by_render": is_empty,
-                            "reason": reason,
-                            **diagnostics,
-                        }
-                    )
-                decisions.append(
-                    PageDecision(
-                        page_index=page_index,
-                        is_empty=is_empty,
-                        reason=reason,
-                        details={
-                            "dpi": dpi,
-                            "ink_ratio": ink_ratio,
-                            "pixel_count": pixel_count,
-                            "sample_margin_inches": list(sample_margin_inches),
-                            "sample_box_px": diagnostics["sample_box_px"],
-                            "background": effective_background,
-                            "white_threshold": white_threshold,
-                            "invalid_sample_area": invalid_sample_area,
-                        },
-                    )
-                )
-            except Exception as exc:
-                if debug_sink is not None:
-                    debug_sink(
-                        {
-                            "page_index_0": page_index,
-                            "page_index_1": page_index + 1,
-                            "ink_ratio": None,
-                            "is_empty_by_render": False,
-                            "reason": "render_failed",
-                            "dpi": dpi,
-                            "sample_margin_inches": list(sample_margin_inches),
-                            "background": effective_background,
-                            "white_threshold": white_threshold,
-                            "error": str(exc),
-                        }
-                    )
-                decisions.append(
-                    PageDecision(
-                        page_index=page_index,
-                        is_empty=False,
-                        reason="render_failed",
-                        details={
-                            "dpi": dpi,
-                            "ink_ratio": None,
-                            "pixel_count": 0,
-                            "sample_margin_inches": list(sample_margin_inches),
-                            "background": effective_background,
-                            "white_threshold": white_threshold,
-                            "error": str(exc),
-                        },
-                    )
-                )
-            finally:
-                if bitmap is not None:
-                    bitmap.close()
+                if debug_sink is not None and record is not None:
+                    debug_sink(record)
+                emit(decision)
+            return None if decision_sink is not None else decisions
     finally:
         close = getattr(document, "close", None)
         if callable(close):
             close()
 
-    return decisions
+    _render_page_decisions_parallel(
+        input_path=input_path,
+        page_count=page_count,
+        settings=settings,
+        debug_sink=debug_sink,
+        decision_sink=emit,
+        max_workers=max_workers,
+    )
+    return None if decision_sink is not None else decisions
+
+
+@dataclass(frozen=True, slots=True)
+class _RenderSettings:
+    dpi: int
+    ink_threshold: float
+    background: str
+    sample_margin_inches: tuple[float, float, float, float]
+    white_threshold: int
+    candidate_pages: frozenset[int] | None = None
+    screening_dpi: int | None = None
+    sample_step: int = 1
+
+
+def _page_decision(
+    document: Any,
+    page_index: int,
+    settings: _RenderSettings,
+    bitmap_maker: Callable[..., Any],
+    collect_debug: bool,
+) -> tuple[PageDecision, dict[str, JSONValue] | None]:
+    if settings.candidate_pages is not None and page_index not in settings.candidate_pages:
+        return _skipped_page_decision(page_index, settings=settings, collect_debug=collect_debug)
+    return _render_page_decision(
+        document[page_index],
+        page_index=page_index,
+        settings=settings,
+        bitmap_maker=bitmap_maker,
+        collect_debug=collect_debug,
+    )
+
+
+def _skipped_page_decision(
+    page_index: int,
+    settings: _RenderSettings,
+    collect_debug: bool,
+) -> tuple[PageDecision, dict[str, JSONValue] | None]:
+    record: dict[str, JSONValue] | None = None
+    if collect_debug:
+        record = {
+            "page_index_0": page_index,
+            "page_index_1": page_index + 1,
+            "ink_ratio": None,
+            "is_empty_by_render": False,
+            "reason": "skipped_by_prefilter",
+            "dpi": settings.dpi,
+            "sample_margin_inches": list(settings.sample_margin_inches),
+            "background": settings.background,
+            "white_threshold": settings.white_threshold,
+        }
+    decision = PageDecision(
+        page_index=page_index,
+        is_empty=False,
+        reason="skipped_by_prefilter",
+        details={
+            "dpi": settings.dpi,
+            "ink_ratio": None,
+            "pixel_count": 0,
+            "sample_margin_inches": list(settings.sample_margin_inches),
+            "background": settings.background,
+            "white_threshold": settings.white_threshold,
+        },
+    )
+    return decision, record
+
+
+def _render_page_decision(
+    page: Any,
+    page_index: int,
+    settings: _RenderSettings,
+    bitmap_maker: Callable[..., Any],
+    collect_debug: bool,
+) -> tuple[PageDecision, dict[str, JSONValue] | None]:
+    dpi = settings.dpi
+    sample_margin_inches = settings.sample_margin_inches
+    effective_background = settings.background
+    white_threshold = settings.white_threshold
+    screening_ink_ratio: float | None = None
+    try:
+        measurement: _InkMeasurement | None = None
+        screening_dpi = settings.screening_dpi
+        if screening_dpi is not None and screening_dpi < dpi:
+            # A coarse render may only settle pages that are clearly inked;
+            # anything near or below the threshold is re-rendered at full DPI,
+            # so a low-resolution pass can never be what marks a page empty.
+            screening = _render_and_measure(
+                page,
+                dpi=screening_dpi,
+                settings=settings,
+                bitmap_maker=bitmap_maker,
+                collect_diagnostics=collect_debug,
+            )
+            screening_ink_ratio = screening.ink_ratio
+            if (
+                not screening.invalid_sample_area
+                and screening_ink_ratio > _SCREENING_MARGIN * settings.ink_threshold
+            ):
+                measurement = screening
+                dpi = screening_dpi
+        if measurement is None:
+            measurement = _render_and_measure(
+                page,
+                dpi=dpi,
+                settings=settings,
+                bitmap_maker=bitmap_maker,
+                collect_diagnostics=collect_debug,
+            )
+        pixel_count = measurement.sampled_pixel_count
+        ink_ratio = measurement.ink_ratio
+        invalid_sample_area = measurement.invalid_sample_area
+        is_empty = (ink_ratio < settings.ink_threshold) if not invalid_sample_area else False
+        reason = (
+            "invalid_sample_area"
+            if invalid_sample_area
+            else "ink_below_threshold" if is_empty else "ink_above_threshold"
+        )
+        record: dict[str, JSONValue] | None = None
+        if collect_debug:
+            record = {
+                "page_index_0": page_index,
+                "page_index_1": page_index + 1,
+                "ink_ratio": ink_ratio,
+                "is_empty_by_render": is_empty,
+                "reason": reason,
+                **(measurement.diagnostics or {}),
+            }
+        decision = PageDecision(
+            page_index=page_index,
+            is_empty=is_empty,
+            reason=reason,
+            details={
+                "dpi": dpi,
+                "ink_ratio": ink_ratio,
+                "pixel_count": pixel_count,
+                "sample_margin_inches": list(sample_margin_inches),
+                "sample_box_px": list(measurement.sample_box_px),
+                "background": effective_background,
+                "white_threshold": white_threshold,
+                "invalid_sample_area": invalid_sample_area,
+            },
+        )
+        if settings.sample_step > 1:
+            decision.details["sample_step"] = settings.sample_step
+        if screening_dpi is not None:
+            decision.details["screening_dpi"] = screening_dpi
+            decision.details["screening_ink_ratio"] = screening_ink_ratio
+        return decision, record
+    except Exception as exc:
+        record = None
+        if collect_debug:
+            record = {
+                "page_index_0": page_index,
+                "page_index_1": page_index + 1,
+                "ink_ratio": None,
+                "is_empty_by_render": False,
+                "reason": "render_failed",
+                "dpi": dpi,
+                "sample_margin_inches": list(sample_margin_inches),
+                "background": effective_background,
+                "white_threshold": white_threshold,
+                "error": str(exc),
+            }
+        decision = PageDecision(
+            page_index=page_index,
+            is_empty=False,
+            reason="render_failed",
+            details={
+                "dpi": dpi,
+                "ink_ratio": None,
+                "pixel_count": 0,
+                "sample_margin_inches": list(sample_margin_inches),
+                "background": effective_background,
+                "white_threshold": white_threshold,
+                "error": str(exc),
+            },
+        )
+        return decision, record
+
+
+_SCREENING_MARGIN = 2.0
+
+
+def _render_and_measure(
+    page: Any,
+    dpi: int,
+    settings: _RenderSettings,
+    bitmap_maker: Callable[..., Any],
+    collect_diagnostics: bool,
+) -> _InkMeasurement:
+    bitmap = page.render(scale=dpi / 72.0, bitmap_maker=bitmap_maker)
+    try:
+        return _measure_ink_ratio(
+            bitmap=bitmap,
+            background=settings.background,
+            dpi=dpi,
+            sample_margin_inches=settings.sample_margin_inches,
+            white_threshold=settings.white_threshold,
+            collect_diagnostics=collect_diagnostics,
+            sample_step=settings.sample_step,
+        )
+    finally:
+        bitmap.close()
+
+
+class _ReusableBitmapMaker:
+    # PDFium writes into a caller-owned ctypes buffer that is kept across pages
+    # and only grows, instead of allocating and zeroing a fresh one per render.
+    # render() fills the whole bitmap before drawing, so stale pixels from a
+    # previous page never survive. Each bitmap must be closed before the next
+    # page is rendered; closing a native bitmap leaves the buffer intact.
+
+    def __init__(self, pdfium: Any) -> None:
+        self._new_native = pdfium.PdfBitmap.new_native
+        self._buffer: Any = None
+
+    def __call__(self, width: int, height: int, format: int, rev_byteorder: bool = False) -> Any:
+        # Four bytes per pixel covers every PDFium bitmap format.
+        size = width * height * 4
+        if self._buffer is None or len(self._buffer) < size:
+            self._buffer = (ctypes.c_ubyte * size)()
+        return self._new_native(
+            width,
+            height,
+            format,
+            rev_byteorder=rev_byteorder,
+            buffer=self._buffer,
+        )
+
+
+_PARALLEL_MIN_PAGES = 4
+
+
+def _use_page_workers(max_workers: int | None, page_count: int) -> bool:
+    return max_workers is not None and max_workers > 1 and page_count >= _PARALLEL_MIN_PAGES
+
+
+_RENDER_WORKER_DOCUMENT: Any = None
+_RENDER_WORKER_SETTINGS: _RenderSettings | None = None
+_RENDER_WORKER_COLLECT_DEBUG = False
+_RENDER_WORKER_BITMAP_MAKER: _ReusableBitmapMaker | None = None
+
+
+def _render_page_decisions_parallel(
+    input_path: Path,
+    page_count: int,
+    settings: _RenderSettings,
+    debug_sink: Callable[[dict[str, JSONValue]], None] | None,
+    decision_sink: Callable[[PageDecision], None],
+    max_workers: int,
+) -> None:
+    chunk_size = max(1, page_count // (4 * max_workers))
+    page_ranges = [
+        (start, min(start + chunk_size, page_count))
+        for start in range(0, page_count, chunk_size)
+    ]
+    # PDFium documents are neither picklable nor thread-safe, so each worker
+    # process opens the file itself.
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(page_ranges)),
+        initializer=_init_render_worker,
+        initargs=(str(input_path), settings, debug_sink is not None),
+    ) as executor:
+        for chunk_decisions, chunk_records in executor.map(_render_page_range, page_ranges):
+            for decision in chunk_decisions:
+                decision_sink(decision)
+            if debug_sink is not None:
+                for record in chunk_records:
+                    debug_sink(record)
+
+
+def _init_render_worker(input_path: str, settings: _RenderSettings, collect_debug: bool) -> None:
+    global _RENDER_WORKER_DOCUMENT, _RENDER_WORKER_SETTINGS, _RENDER_WORKER_COLLECT_DEBUG
+    global _RENDER_WORKER_BITMAP_MAKER
+    pdfium = _load_pdfium()
+    _RENDER_WORKER_DOCUMENT = pdfium.PdfDocument(input_path)
+    _RENDER_WORKER_BITMAP_MAKER = _ReusableBitmapMaker(pdfium)
+    _RENDER_WORKER_SETTINGS = settings
+    _RENDER_WORKER_COLLECT_DEBUG = collect_debug
+
+
+def _render_page_range(
+    page_range: tuple[int, int],
+) -> tuple[list[PageDecision], list[dict[str, JSONValue]]]:
+    if (
+        _RENDER_WORKER_DOCUMENT is None
+        or _RENDER_WORKER_SETTINGS is None
+        or _RENDER_WORKER_BITMAP_MAKER is None
+    ):
+        raise RuntimeError("Render worker was not initialized.")
+    decisions: list[PageDecision] = []
+    records: list[dict[str, JSONValue]] = []
+    for page_index in range(*page_range):
+        decision, record = _page_decision(
+            _RENDER_WORKER_DOCUMENT,
+            page_index=page_index,
+            settings=_RENDER_WORKER_SETTINGS,
+            bitmap_maker=_RENDER_WORKER_BITMAP_MAKER,
+            collect_debug=_RENDER_WORKER_COLLECT_DEBUG,
+        )
+        decisions.append(decision)
+        if record is not None:
+            records.append(record)
+    return decisions, records
+
+
+@dataclass(frozen=True, slots=True)
+class _InkMeasurement:
+    ink_ratio: float
+    sampled_pixel_count: int
+    sample_box_px: tuple[int, int, int, int]
+    invalid_sample_area: bool
+    diagnostics: dict[str, JSONValue] | None
 
 
 def _measure_ink_ratio(
@@ -151,7 +454,9 @@ def _measure_ink_ratio(
     dpi: int,
     sample_margin_inches: tuple[float, float, float, float],
     white_threshold: int,
-) -> dict[str, JSONValue]:
+    collect_diagnostics: bool = True,
+    sample_step: int = 1,
+) -> _InkMeasurement:
     if background != "white":
         raise ValueError("Only white background sampling is implemented.")
 
@@ -162,79 +467,107 @@ def _measure_ink_ratio(
     if channels < 3:
         raise ValueError("Bitmap must expose at least three color channels.")
 
-    raw = bytes(bitmap.buffer)
     start_x, end_x, start_y, end_y = _sample_bounds(
         width=width,
         height=height,
         dpi=dpi,
         sample_margin_inches=sample_margin_inches,
     )
+    sample_box_px = (start_x, start_y, end_x, end_y)
     pixel_count = max(0, end_x - start_x) * max(0, end_y - start_y)
     if pixel_count == 0:
-        return {
+        diagnostics: dict[str, JSONValue] | None = None
+        if collect_diagnostics:
+            diagnostics = {
+                "height_px": height,
+                "ink_ratio": 0.0,
+                "invalid_sample_area": True,
+                "max_alpha": None,
+                "max_rgb": [0, 0, 0],
+                "min_alpha": None,
+                "min_rgb": [255, 255, 255],
+                "nonwhite_pixel_count": 0,
+                "pixel_format": _pixel_format(channels),
+                "sample_margin_inches": list(sample_margin_inches),
+                "sample_box_px": list(sample_box_px),
+                "sampled_pixel_count": 0,
+                "white_threshold": white_threshold,
+                "width_px": width,
+            }
+        return _InkMeasurement(
+            ink_ratio=0.0,
+            sampled_pixel_count=0,
+            sample_box_px=sample_box_px,
+            invalid_sample_area=True,
+            diagnostics=diagnostics,
+        )
+
+    # A flat byte view over the PDFium buffer; only the sampled rows get copied.
+    raw = memoryview(bitmap.buffer).cast("B")
+    sample = _sample_bytes(
+        raw=raw,
+        stride=stride,
+        channels=channels,
+        start_x=start_x,
+        end_x=end_x,
+        start_y=start_y,
+        end_y=end_y,
+        row_step=sample_step,
+    )
+    if sample_step > 1:
+        sample = _every_nth_pixel(
+            sample,
+            row_length=(end_x - start_x) * channels,
+            channels=channels,
+            step=sample_step,
+        )
+        pixel_count = len(range(start_x, end_x, sample_step)) * len(
+            range(start_y, end_y, sample_step)
+        )
+    alpha = sample[3::channels] if channels >= 4 else None
+    non_background_pixels = _count_non_white_pixels(
+        sample=sample,
+        channels=channels,
+        alpha=alpha,
+        white_threshold=white_threshold,
+    )
+    ink_ratio = non_background_pixels / pixel_count
+    if not collect_diagnostics:
+        return _InkMeasurement(
+            ink_ratio=ink_ratio,
+            sampled_pixel_count=pixel_count,
+            sample_box_px=sample_box_px,
+            invalid_sample_area=False,
+            diagnostics=None,
+        )
+
+    # Channel extremes only feed the render debug artifact; each one is a full
+    # pass over a plane, so they are only computed alongside the diagnostics.
+    blue = sample[0::channels]
+    green = sample[1::channels]
+    red = sample[2::channels]
+    return _InkMeasurement(
+        ink_ratio=ink_ratio,
+        sampled_pixel_count=pixel_count,
+        sample_box_px=sample_box_px,
+        invalid_sample_area=False,
+        diagnostics={
             "height_px": height,
-            "ink_ratio": 0.0,
-            "invalid_sample_area": True,
-            "max_alpha": None,
-            "max_rgb": [0, 0, 0],
-            "min_alpha": None,
-            "min_rgb": [255, 255, 255],
-            "nonwhite_pixel_count": 0,
+            "ink_ratio": ink_ratio,
+            "invalid_sample_area": False,
+            "max_alpha": max(alpha) if alpha is not None else None,
+            "max_rgb": [max(red), max(green), max(blue)],
+            "min_alpha": min(alpha) if alpha is not None else None,
+            "min_rgb": [min(red), min(green), min(blue)],
+            "nonwhite_pixel_count": non_background_pixels,
             "pixel_format": _pixel_format(channels),
             "sample_margin_inches": list(sample_margin_inches),
-            "sample_box_px": [start_x, start_y, end_x, end_y],
-            "sampled_pixel_count": 0,
+            "sample_box_px": list(sample_box_px),
+            "sampled_pixel_count": pixel_count,
             "white_threshold": white_threshold,
             "width_px": width,
-        }
-
-    non_background_pixels = 0
-    min_rgb = [255, 255, 255]
-    max_rgb = [0, 0, 0]
-    min_alpha: int | None = 255 if channels >= 4 else None
-    max_alpha: int | None = 0 if channels >= 4 else None
-    for y in range(start_y, end_y):
-        row_offset = y * stride
-        for x in range(start_x, end_x):
-            offset = row_offset + x * channels
-            blue = raw[offset]
-            green = raw[offset + 1]
-            red = raw[offset + 2]
-            min_rgb[0] = min(min_rgb[0], red)
-            min_rgb[1] = min(min_rgb[1], green)
-            min_rgb[2] = min(min_rgb[2], blue)
-            max_rgb[0] = max(max_rgb[0], red)
-            max_rgb[1] = max(max_rgb[1], green)
-            max_rgb[2] = max(max_rgb[2], blue)
-            alpha = raw[offset + 3] if channels >= 4 else None
-            if alpha is not None and min_alpha is not None and max_alpha is not None:
-                min_alpha = min(min_alpha, alpha)
-                max_alpha = max(max_alpha, alpha)
-            if not _pixel_is_white(
-                red=red,
-                green=green,
-                blue=blue,
-                alpha=alpha,
-                white_threshold=white_threshold,
-            ):
-                non_background_pixels += 1
-
-    return {
-        "height_px": height,
-        "ink_ratio": non_background_pixels / pixel_count,
-        "invalid_sample_area": False,
-        "max_alpha": max_alpha,
-        "max_rgb": max_rgb,
-        "min_alpha": min_alpha,
-        "min_rgb": min_rgb,
-        "nonwhite_pixel_count": non_background_pixels,
-        "pixel_format": _pixel_format(channels),
-        "sample_margin_inches": list(sample_margin_inches),
-        "sample_box_px": [start_x, start_y, end_x, end_y],
-        "sampled_pixel_count": pixel_count,
-        "white_threshold": white_threshold,
-        "width_px": width,
-    }
+        },
+    )
 
 
 def _sample_bounds(
@@ -255,16 +588,67 @@ def _sample_bounds(
     return x0, x1, y0, y1
 
 
-def _pixel_is_white(
-    red: int,
-    green: int,
-    blue: int,
-    alpha: int | None,
+def _sample_bytes(
+    raw: memoryview,
+    stride: int,
+    channels: int,
+    start_x: int,
+    end_x: int,
+    start_y: int,
+    end_y: int,
+    row_step: int = 1,
+) -> bytes:
+    row_start = start_x * channels
+    row_end = end_x * channels
+    if row_start == 0 and row_end == stride and row_step == 1:
+        return raw[start_y * stride : end_y * stride].tobytes()
+    return b"".join(
+        raw[row_offset + row_start : row_offset + row_end]
+        for row_offset in range(start_y * stride, end_y * stride, stride * row_step)
+    )
+
+
+def _every_nth_pixel(sample: bytes, row_length: int, channels: int, step: int) -> bytes:
+    # Each channel is gathered with one strided slice per row and written back
+    # interleaved, so the result has the same layout as a full-resolution sample.
+    pixel_stride = channels * step
+    row_offsets = range(0, len(sample), row_length)
+    columns = len(range(0, row_length, pixel_stride))
+    picked = bytearray(len(row_offsets) * columns * channels)
+    for channel in range(channels):
+        picked[channel::channels] = b"".join(
+            sample[row_offset + channel : row_offset + row_length : pixel_stride]
+            for row_offset in row_offsets
+        )
+    return bytes(picked)
+
+
+def _count_non_white_pixels(
+    sample: bytes,
+    channels: int,
+    alpha: bytes | None,
     white_threshold: int,
-) -> bool:
-    if alpha == 0:
-        return True
-    return red >= white_threshold and green >= white_threshold and blue >= white_threshold
+) -> int:
+    # One translate turns every interleaved byte into a 0/1 below-threshold flag.
+    # The B, G and R flag lanes are then OR-ed as big integers, giving one bit
+    # per pixel that has any colour channel below the threshold.
+    flags = sample.translate(_below_threshold_table(white_threshold))
+    non_white = (
+        int.from_bytes(flags[0::channels], "little")
+        | int.from_bytes(flags[1::channels], "little")
+        | int.from_bytes(flags[2::channels], "little")
+    )
+    if alpha is not None:
+        non_white &= int.from_bytes(alpha.translate(_NON_ZERO_TABLE), "little")
+    return non_white.bit_count()
+
+
+@lru_cache(maxsize=8)
+def _below_threshold_table(white_threshold: int) -> bytes:
+    return bytes(1 if value < white_threshold else 0 for value in range(256))
+
+
+_NON_ZERO_TABLE = bytes(0 if value == 0 else 1 for value in range(256))
 
 
 def _pixel_format(channels: int) -> str:
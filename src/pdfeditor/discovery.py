@@ -0,0 +1,49 @@
+"""PDF input discovery for PDFEditor."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterator
+
+
+def discover_pdfs(path: Path, recursive: bool) -> list[Path]:
+    """Discover candidate PDFs for processing."""
+    return sorted(Path(entry.path) for entry in _iter_pdf_entries(path, recursive=recursive))
+
+
+def is_edited_pdf_name(name: str) -> bool:
+    """Return whether a file name ends in `.edited.pdf` or `.edited.<n>.pdf`."""
+    lowered = name.lower()
+    if not lowered.endswith(".pdf"):
+        return False
+    stem = lowered[:-4]
+    if stem.endswith(".edited"):
+        return True
+    dot = stem.rfind(".")
+    return dot > 0 and stem[dot + 1:].isdecimal() and stem[:dot].endswith(".edited")
+
+
+def _iter_pdf_entries(path: Path, recursive: bool) -> Iterator[os.DirEntry[str]]:
+    """Yield PDF directory entries, filtering by name before touching file metadata."""
+    pending = [str(path)]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            if directory == str(path):
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                if len(name) <= 4 or name[-4:].lower() != ".pdf":
+                    continue
+                if is_edited_pdf_name(name):
+                    continue
+                if entry.is_file():
+                    yield entry
@@ -8,7 +8,7 @@ JSONScalar = str | int | float | bool | None
 JSONValue = JSONScalar | list["JSONValue"] | dict[str, "JSONValue"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunConfig:
     """Configuration for a single CLI run."""
 
@@ -38,9 +38,11 @@ class RunConfig:
     strict_xref: bool
     debug_render: bool
     verbose: bool
+    workers: int = 1
+    worker_backend: str = "process"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageDecision:
     """A structured empty-page decision for one page."""
 
@@ -50,7 +52,7 @@ class PageDecision:
     details: dict[str, JSONValue]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RewriteResult:
     """Result details for a rewritten PDF."""
 
@@ -65,7 +67,7 @@ class RewriteResult:
     warnings: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileResult:
     """Processing result for a single PDF."""
 
@@ -91,7 +93,7 @@ class FileResult:
     timings: dict[str, float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunResult:
     """Aggregated result for a full CLI run."""
 
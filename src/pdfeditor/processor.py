@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from datetime import datetime
+from io import BytesIO
 import json
+import os
 from pathlib import Path
-from time import perf_counter
+import shutil
+from time import perf_counter_ns
 
 from pypdf import PdfReader
 
@@ -25,10 +30,12 @@ def process_pdf(input_path: Path, out_dir: Path, config: RunConfig) -> FileResul
     warnings: list[str] = []
     errors: list[str] = []
     timings: dict[str, float] = {}
-    run_start = perf_counter()
-    structural_debug_records: list[dict[str, JSONValue]] = []
+    run_start = perf_counter_ns()
+    # One timestamp names every artifact this run writes for the file.
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    structural_debug_writer: _JsonArtifactWriter | None = None
     structural_debug_path: Path | None = None
-    render_debug_records: list[dict[str, JSONValue]] = []
+    render_debug_writer: _JsonArtifactWriter | None = None
     render_debug_path: Path | None = None
     stamp_debug_path: Path | None = None
     warning_collector = PyPdfWarningCollector()
@@ -42,90 +49,99 @@ def process_pdf(input_path: Path, out_dir: Path, config: RunConfig) -> FileResul
 
     try:
         with warning_context:
-            reader = PdfReader(str(input_path))
+            # pypdf reads the whole file into memory regardless; reading it here
+            # lets the render pass load the same bytes instead of the file again.
+            source = input_path.read_bytes()
+            reader = PdfReader(BytesIO(source))
             if reader.is_encrypted:
                 raise ValueError("encrypted")
 
             pages_original = len(reader.pages)
 
-            detect_start = perf_counter()
-            structural_decisions = detect_page_decisions(
-                reader=reader,
-                treat_annotations_as_empty=config.treat_annotations_as_empty,
-                debug_sink=structural_debug_records.append if config.debug_structural else None,
-            )
+            detect_start = perf_counter_ns()
+            # Debug records go to their artifact as the detectors emit them, so
+            # long documents never hold every page's record in memory.
+            if config.debug_structural:
+                structural_debug_writer = _open_structural_debug_artifact(
+                    input_path=input_path,
+                    report_dir=Path(config.report_dir),
+                    timestamp=run_timestamp,
+                )
+            if config.debug_render and config.effective_mode in {"render", "both"}:
+                render_debug_writer = _open_render_debug_artifact(
+                    input_path=input_path,
+                    report_dir=Path(config.report_dir),
+                    timestamp=run_timestamp,
+                    config=config,
+                )
+            structural_debug_sink = structural_debug_writer.append if structural_debug_writer is not None else None
+            render_debug_sink = render_debug_writer.append if render_debug_writer is not None else None
             render_decisions: list[PageDecision] | None = None
             if config.effective_mode in {"render", "both"}:
-                render_decisions = detect_empty_pages_render(
-                    input_path=input_path,
-                    dpi=config.render_dpi,
-                    ink_threshold=config.ink_threshold,
-                    background=config.effective_background,
-                    sample_margin_inches=config.render_sample_margin,
-                    white_threshold=config.white_threshold,
-                    debug_sink=render_debug_records.append if config.debug_render else None,
+                # PDFium releases the GIL while rasterizing, so the render pass
+                # runs on a helper thread alongside the pure-Python structural
+                # scan, which render mode still needs for its decision details.
+                # pypdf is only used on this thread, so warning capture (which
+                # is bound to this thread) sees the same events as before.
+                with ThreadPoolExecutor(max_workers=1) as render_executor:
+                    render_future = render_executor.submit(
+                        _timed_render_decisions,
+                        input_path,
+                        config,
+                        render_debug_sink,
+                        source,
+                    )
+                    structural_decisions, timings["detection_structural_seconds"] = (
+                        _timed_structural_decisions(reader, config, structural_debug_sink)
+                    )
+                    render_decisions, timings["detection_render_seconds"] = render_future.result()
+            else:
+                structural_decisions, timings["detection_structural_seconds"] = (
+                    _timed_structural_decisions(reader, config, structural_debug_sink)
                 )
             decisions = _combine_decisions(
                 structural_decisions=structural_decisions,
                 render_decisions=render_decisions,
                 mode=config.effective_mode,
             )
-            timings["detection_seconds"] = round(perf_counter() - detect_start, 6)
+            timings["detection_seconds"] = _elapsed_seconds(detect_start)
     except Exception as exc:
+        for debug_writer in (structural_debug_writer, render_debug_writer):
+            if debug_writer is not None:
+                debug_writer.discard()
         status_error = str(exc)
         if status_error == "encrypted":
             errors.append("encrypted")
         else:
             errors.append(f"read_error: {exc}")
-        pages_original = 0
-        decisions = []
-        timings["total_seconds"] = round(perf_counter() - run_start, 6)
+        timings["total_seconds"] = _elapsed_seconds(run_start)
         if capture_enabled:
             pypdf_warnings_path = _write_pypdf_warnings_artifact(
                 input_path=input_path,
                 report_dir=Path(config.report_dir),
+                timestamp=run_timestamp,
                 collector=warning_collector,
             )
-        return FileResult(
-            input_path=str(input_path),
-            output_path=None,
-            status="failed",
-            pages_original=pages_original,
-            pages_removed=0,
-            pages_output=0,
-            decisions_summary={"empty_pages": 0, "non_empty_pages": 0},
-            page_decisions=decisions,
-            structural_debug_path=None,
+        return build_failed_file_result(
+            input_path,
+            config,
+            errors,
             pypdf_warnings_count=len(warning_collector.events),
-            pypdf_warnings_path=str(pypdf_warnings_path) if pypdf_warnings_path is not None else None,
-            render_debug_path=None,
-            stamping_enabled=config.stamp_page_numbers,
-            stamping_applied_pages=0,
-            stamping_forced_pages=0,
-            stamping_skipped_pages=0,
-            stamping_debug_path=None,
+            pypdf_warnings_path=pypdf_warnings_path,
             warnings=warnings,
-            errors=errors,
             timings=timings,
         )
 
-    if config.debug_structural:
-        structural_debug_path = _write_structural_debug_artifact(
-            input_path=input_path,
-            report_dir=Path(config.report_dir),
-            records=structural_debug_records,
-        )
-    if config.debug_render and config.effective_mode in {"render", "both"}:
-        render_debug_path = _write_render_debug_artifact(
-            input_path=input_path,
-            report_dir=Path(config.report_dir),
-            records=render_debug_records,
-            config=config,
-        )
+    decisions_summary, pages_to_keep = _tally_decisions(decisions)
+    if structural_debug_writer is not None:
+        structural_debug_path = structural_debug_writer.close()
+    if render_debug_writer is not None:
+        render_debug_path = render_debug_writer.close()
     if capture_enabled:
         pypdf_warnings_path = _write_pypdf_warnings_artifact(
             input_path=input_path,
             report_dir=Path(config.report_dir),
+            timestamp=run_timestamp,
             collector=warning_collector,
         )
 
@@ -135,37 +151,24 @@ def process_pdf(input_path: Path, out_dir: Path, config: RunConfig) -> FileResul
             errors.append(
                 f"pypdf warnings were captured; see {pypdf_warnings_path}"
             )
-        timings["total_seconds"] = round(perf_counter() - run_start, 6)
-        return FileResult(
-            input_path=str(input_path),
-            output_path=None,
-            status="failed",
+        timings["total_seconds"] = _elapsed_seconds(run_start)
+        return build_failed_file_result(
+            input_path,
+            config,
+            errors,
             pages_original=pages_original,
-            pages_removed=0,
-            pages_output=0,
-            decisions_summary=_summarize_decisions(decisions),
-            page_decisions=decisions,
-            structural_debug_path=str(structural_debug_path) if structural_debug_path is not None else None,
+            decisions=decisions,
+            decisions_summary=decisions_summary,
+            structural_debug_path=structural_debug_path,
+            render_debug_path=render_debug_path,
             pypdf_warnings_count=len(warning_collector.events),
-            pypdf_warnings_path=str(pypdf_warnings_path) if pypdf_warnings_path is not None else None,
-            render_debug_path=str(render_debug_path) if render_debug_path is not None else None,
-            stamping_enabled=config.stamp_page_numbers,
-            stamping_applied_pages=0,
-            stamping_forced_pages=0,
-            stamping_skipped_pages=0,
-            stamping_debug_path=None,
+            pypdf_warnings_path=pypdf_warnings_path,
             warnings=warnings,
-            errors=errors,
             timings=timings,
         )
 
-    pages_to_keep = [
-        decision.page_index
-        for decision in decisions
-        if not decision.is_empty
-    ]
     pages_removed = pages_original - len(pages_to_keep)
-    pages_output = len(pages_to_keep) if pages_removed else pages_original
+    pages_output = len(pages_to_keep)
 
     output_path: Path | None = None
     if pages_removed > 0 or config.write_when_unchanged:
@@ -175,27 +178,20 @@ def process_pdf(input_path: Path, out_dir: Path, config: RunConfig) -> FileResul
     if config.stamp_page_numbers and output_path is not None and not is_render_backend_available():
         errors.append("stamping_requires_pypdfium2")
         errors.append("Page-number stamping requires optional dependency 'pypdfium2'.")
-        timings["total_seconds"] = round(perf_counter() - run_start, 6)
-        return FileResult(
-            input_path=str(input_path),
-            output_path=None,
-            status="failed",
+        timings["total_seconds"] = _elapsed_seconds(run_start)
+        return build_failed_file_result(
+            input_path,
+            config,
+            errors,
             pages_original=pages_original,
             pages_removed=pages_removed,
-            pages_output=0,
-            decisions_summary=_summarize_decisions(decisions),
-            page_decisions=decisions,
-            structural_debug_path=str(structural_debug_path) if structural_debug_path is not None else None,
+            decisions=decisions,
+            decisions_summary=decisions_summary,
+            structural_debug_path=structural_debug_path,
+            render_debug_path=render_debug_path,
             pypdf_warnings_count=len(warning_collector.events),
-            pypdf_warnings_path=str(pypdf_warnings_path) if pypdf_warnings_path is not None else None,
-            render_debug_path=str(render_debug_path) if render_debug_path is not None else None,
-            stamping_enabled=True,
-            stamping_applied_pages=0,
-            stamping_forced_pages=0,
-            stamping_skipped_pages=0,
-            stamping_debug_path=None,
+            pypdf_warnings_path=pypdf_warnings_path,
             warnings=warnings,
-            errors=errors,
             timings=timings,
         )
 
@@ -206,22 +202,33 @@ def process_pdf(input_path: Path, out_dir: Path, config: RunConfig) -> FileResul
             status = "unchanged"
         elif output_path is None:
             status = "unchanged"
+        elif pages_removed == 0 and not config.stamp_page_numbers:
+            # Nothing to drop or stamp, so the output is the document itself: a
+            # byte copy (kernel-side where supported) replaces a full pypdf
+            # clone and re-serialization. A hard link is avoided on purpose, as
+            # it would tie the output to the original's inode.
+            write_start = perf_counter_ns()
+            shutil.copyfile(input_path, output_path)
+            timings["write_seconds"] = _elapsed_seconds(write_start)
+            status = "copied"
         else:
-            write_start = perf_counter()
+            write_start = perf_counter_ns()
             rewrite_result = rewrite_pdf(
                 input_path=input_path,
                 output_path=output_path,
-                pages_to_keep=pages_to_keep if pages_removed else list(range(pages_original)),
+                pages_to_keep=pages_to_keep,
                 bookmark_policy="drop",
                 stamp_config=_stamp_config(config) if config.stamp_page_numbers else None,
+                reader=reader,
             )
-            timings["write_seconds"] = round(perf_counter() - write_start, 6)
+            timings["write_seconds"] = _elapsed_seconds(write_start)
             warnings.extend(rewrite_result.warnings)
             pages_output = rewrite_result.pages_output
             if config.debug_render and rewrite_result.stamp_decisions:
                 stamp_debug_path = _write_stamp_debug_artifact(
                     input_path=input_path,
                     report_dir=Path(config.report_dir),
+                    timestamp=run_timestamp,
                     records=rewrite_result.stamp_decisions,
                     config=config,
                 )
@@ -232,7 +239,7 @@ def process_pdf(input_path: Path, out_dir: Path, config: RunConfig) -> FileResul
         output_path = None
         pages_output = 0
 
-    timings["total_seconds"] = round(perf_counter() - run_start, 6)
+    timings["total_seconds"] = _elapsed_seconds(run_start)
     return FileResult(
         input_path=str(input_path),
         output_path=str(output_path) if output_path is not None else None,
@@ -240,7 +247,7 @@ def process_pdf(input_path: Path, out_dir: Path, config: RunConfig) -> FileResul
         pages_original=pages_original,
         pages_removed=pages_removed,
         pages_output=pages_output,
-        decisions_summary=_summarize_decisions(decisions),
+        decisions_summary=decisions_summary,
         page_decisions=decisions,
         structural_debug_path=str(structural_debug_path) if structural_debug_path is not None else None,
         pypdf_warnings_count=len(warning_collector.events),
@@ -257,56 +264,206 @@ def process_pdf(input_path: Path, out_dir: Path, config: RunConfig) -> FileResul
     )
 
 
+def process_pdfs(
+    input_paths: Sequence[Path],
+    out_dir: Path,
+    config: RunConfig,
+) -> list[FileResult]:
+    """Process several PDFs in order and return one file result per input."""
+    return [
+        process_pdf(input_path, out_dir=out_dir, config=config)
+        for input_path in input_paths
+    ]
+
+
+def build_failed_file_result(
+    input_path: Path,
+    config: RunConfig,
+    errors: list[str],
+    *,
+    pages_original: int = 0,
+    pages_removed: int = 0,
+    decisions: list[PageDecision] | None = None,
+    decisions_summary: dict[str, int] | None = None,
+    structural_debug_path: Path | None = None,
+    render_debug_path: Path | None = None,
+    pypdf_warnings_count: int = 0,
+    pypdf_warnings_path: Path | None = None,
+    warnings: list[str] | None = None,
+    timings: dict[str, float] | None = None,
+) -> FileResult:
+    """Return a failed file result for a PDF that could not be processed.
+
+    ``decisions`` and their ``decisions_summary`` are given when detection
+    finished before the failure; they are reported as usual, while no output
+    is written.
+    """
+    return FileResult(
+        input_path=str(input_path),
+        output_path=None,
+        status="failed",
+        pages_original=pages_original,
+        pages_removed=pages_removed,
+        pages_output=0,
+        decisions_summary=(
+            decisions_summary
+            if decisions_summary is not None
+            else {"empty_pages": 0, "non_empty_pages": 0}
+        ),
+        page_decisions=decisions if decisions is not None else [],
+        structural_debug_path=str(structural_debug_path) if structural_debug_path is not None else None,
+        pypdf_warnings_count=pypdf_warnings_count,
+        pypdf_warnings_path=str(pypdf_warnings_path) if pypdf_warnings_path is not None else None,
+        render_debug_path=str(render_debug_path) if render_debug_path is not None else None,
+        stamping_enabled=config.stamp_page_numbers,
+        stamping_applied_pages=0,
+        stamping_forced_pages=0,
+        stamping_skipped_pages=0,
+        stamping_debug_path=None,
+        warnings=list(warnings) if warnings is not None else [],
+        errors=list(errors),
+        timings=dict(timings) if timings is not None else {},
+    )
+
+
 def build_output_path(input_path: Path, out_dir: Path) -> tuple[Path, list[str]]:
     """Return a collision-safe edited output path for an input PDF."""
     warnings: list[str] = []
-    out_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_directory(out_dir)
 
     candidate = out_dir / f"{input_path.stem}.edited.pdf"
     if not candidate.exists():
         return candidate, warnings
 
+    existing = _casefolded_entry_names(out_dir)
     suffix = 1
-    while True:
-        candidate = out_dir / f"{input_path.stem}.edited.{suffix}.pdf"
-        if not candidate.exists():
-            warnings.append(
-                f"Output path already existed; wrote to '{candidate.name}' instead."
-            )
-            return candidate, warnings
+    while f"{input_path.stem}.edited.{suffix}.pdf".casefold() in existing:
         suffix += 1
-
-
-def _summarize_decisions(decisions: list[PageDecision]) -> dict[str, int]:
-    summary: dict[str, int] = {
-        "empty_pages": 0,
-        "non_empty_pages": 0,
-        "no_paint_ops_pages": 0,
-        "only_invisible_paint_pages": 0,
-        "render_empty_pages": 0,
-        "structural_empty_pages": 0,
-        "visible_pages": 0,
-        "both_empty_pages": 0,
-    }
+    candidate = out_dir / f"{input_path.stem}.edited.{suffix}.pdf"
+    warnings.append(f"Output path already existed; wrote to '{candidate.name}' instead.")
+    return candidate, warnings
+
+
+def _ensure_directory(directory: Path) -> None:
+    """Create a directory unless it already exists.
+
+    The CLI creates the output and report directories once per run, so the
+    per-file check is normally a single ``stat()`` rather than a ``mkdir()``
+    that fails with ``EEXIST``.
+    """
+    if not directory.is_dir():
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+def _casefolded_entry_names(directory: Path) -> set[str]:
+    """Return the casefolded names of a directory's entries from one scan.
+
+    Collision fallbacks test suffixes against this set instead of issuing one
+    ``stat()`` per attempt. Casefolding keeps the check safe on case-insensitive
+    filesystems; on case-sensitive ones it can only skip a suffix.
+    """
+    with os.scandir(directory) as entries:
+        return {entry.name.casefold() for entry in entries}
+
+
+def _tally_decisions(decisions: list[PageDecision]) -> tuple[dict[str, int], list[int]]:
+    """Return the decisions summary and the kept page indexes from one pass."""
+    pages_to_keep: list[int] = []
+    empty_pages = 0
+    structural_empty_pages = 0
+    render_empty_pages = 0
+    both_empty_pages = 0
+    visible_pages = 0
+    reason_counts: dict[str, int] = {}
+    reason_page_counts = dict.fromkeys(_REASON_PAGE_COUNTERS.values(), 0)
     for decision in decisions:
-        summary["empty_pages" if decision.is_empty else "non_empty_pages"] += 1
-        summary[decision.reason] = summary.get(decision.reason, 0) + 1
+        is_empty = decision.is_empty
+        reason = decision.reason
         details = decision.details
+        if is_empty:
+            empty_pages += 1
+        else:
+            pages_to_keep.append(decision.page_index)
+        reason_counts[reason] = reason_counts.get(reason, 0) + 1
         structural_empty = bool(details.get("structural_is_empty"))
         render_empty = bool(details.get("render_is_empty"))
         if structural_empty:
-            summary["structural_empty_pages"] += 1
+            structural_empty_pages += 1
+            if render_empty:
+                both_empty_pages += 1
         if render_empty:
-            summary["render_empty_pages"] += 1
-        if structural_empty and render_empty:
-            summary["both_empty_pages"] += 1
-        if decision.reason == "only_invisible_paint":
-            summary["only_invisible_paint_pages"] += 1
-        elif decision.reason in {"no_paint_ops", "no_contents", "contents_whitespace_only"}:
-            summary["no_paint_ops_pages"] += 1
-        elif not decision.is_empty:
-            summary["visible_pages"] += 1
-    return summary
+            render_empty_pages += 1
+        reason_counter = _REASON_PAGE_COUNTERS.get(reason)
+        if reason_counter is not None:
+            reason_page_counts[reason_counter] += 1
+        elif not is_empty:
+            visible_pages += 1
+
+    summary: dict[str, int] = {
+        "empty_pages": empty_pages,
+        "non_empty_pages": len(decisions) - empty_pages,
+        "no_paint_ops_pages": reason_page_counts["no_paint_ops_pages"],
+        "only_invisible_paint_pages": reason_page_counts["only_invisible_paint_pages"],
+        "render_empty_pages": render_empty_pages,
+        "structural_empty_pages": structural_empty_pages,
+        "visible_pages": visible_pages,
+        "both_empty_pages": both_empty_pages,
+    }
+    summary.update(reason_counts)
+    return summary, pages_to_keep
+
+
+_REASON_PAGE_COUNTERS = {
+    "only_invisible_paint": "only_invisible_paint_pages",
+    "no_paint_ops": "no_paint_ops_pages",
+    "no_contents": "no_paint_ops_pages",
+    "contents_whitespace_only": "no_paint_ops_pages",
+}
+
+
+def _elapsed_seconds(start_ns: int) -> float:
+    """Return seconds since a ``perf_counter_ns()`` reading, to the microsecond.
+
+    Rounding happens on the integer nanosecond count, so the reported value
+    carries no float error from subtracting two large clock readings.
+    """
+    return (perf_counter_ns() - start_ns + 500) // 1000 / 1_000_000
+
+
+def _timed_structural_decisions(
+    reader: PdfReader,
+    config: RunConfig,
+    debug_sink: Callable[[dict[str, JSONValue]], None] | None,
+) -> tuple[list[PageDecision], float]:
+    """Run structural detection and return its decisions with elapsed seconds."""
+    start = perf_counter_ns()
+    decisions = detect_page_decisions(
+        reader=reader,
+        treat_annotations_as_empty=config.treat_annotations_as_empty,
+        debug_sink=debug_sink,
+    )
+    return decisions, _elapsed_seconds(start)
+
+
+def _timed_render_decisions(
+    input_path: Path,
+    config: RunConfig,
+    debug_sink: Callable[[dict[str, JSONValue]], None] | None,
+    source: bytes | None = None,
+) -> tuple[list[PageDecision] | None, float]:
+    """Run render detection and return its decisions with elapsed seconds."""
+    start = perf_counter_ns()
+    decisions = detect_empty_pages_render(
+        input_path=input_path,
+        dpi=config.render_dpi,
+        ink_threshold=config.ink_threshold,
+        background=config.effective_background,
+        sample_margin_inches=config.render_sample_margin,
+        white_threshold=config.white_threshold,
+        debug_sink=debug_sink,
+        source=source,
+    )
+    return decisions, _elapsed_seconds(start)
 
 
 def _combine_decisions(
@@ -383,27 +540,31 @@ def _combined_page_decision(
     )
 
 
-def _write_structural_debug_artifact(
+def _open_structural_debug_artifact(
     input_path: Path,
     report_dir: Path,
-    records: list[dict[str, JSONValue]],
-) -> Path:
-    """Write per-page structural debugging information for one processed PDF."""
+    timestamp: str,
+) -> _JsonArtifactWriter:
+    """Open the per-page structural debugging artifact for one processed PDF."""
     payload = {
         "input_path": str(input_path),
-        "pages": records,
     }
-    return _write_json_artifact(
-        input_path=input_path,
-        report_dir=report_dir,
-        prefix="structural_debug",
+    return _JsonArtifactWriter(
+        path=_build_timestamped_artifact_path(
+            input_path=input_path,
+            report_dir=report_dir,
+            prefix="structural_debug",
+            timestamp=timestamp,
+        ),
         payload=payload,
+        records_key="pages",
     )
 
 
 def _write_pypdf_warnings_artifact(
     input_path: Path,
     report_dir: Path,
+    timestamp: str,
     collector: PyPdfWarningCollector,
 ) -> Path:
     """Write captured pypdf warnings for one processed PDF."""
@@ -414,18 +575,19 @@ def _write_pypdf_warnings_artifact(
     return _write_json_artifact(
         input_path=input_path,
         report_dir=report_dir,
+        timestamp=timestamp,
         prefix="pypdf_warnings",
         payload=payload,
     )
 
 
-def _write_render_debug_artifact(
+def _open_render_debug_artifact(
     input_path: Path,
     report_dir: Path,
-    records: list[dict[str, JSONValue]],
+    timestamp: str,
     config: RunConfig,
-) -> Path:
-    """Write per-page render debugging information for one processed PDF."""
+) -> _JsonArtifactWriter:
+    """Open the per-page render debugging artifact for one processed PDF."""
     payload = {
         "input_path": str(input_path),
         "render_parameters": {
@@ -435,19 +597,23 @@ def _write_render_debug_artifact(
             "render_sample_margin": list(config.render_sample_margin),
             "background": config.effective_background,
         },
-        "per_page": records,
     }
-    return _write_json_artifact(
-        input_path=input_path,
-        report_dir=report_dir,
-        prefix="render_debug",
+    return _JsonArtifactWriter(
+        path=_build_timestamped_artifact_path(
+            input_path=input_path,
+            report_dir=report_dir,
+            prefix="render_debug",
+            timestamp=timestamp,
+        ),
         payload=payload,
+        records_key="per_page",
     )
 
 
 def _write_stamp_debug_artifact(
     input_path: Path,
     report_dir: Path,
+    timestamp: str,
     records: list[dict[str, JSONValue]],
     config: RunConfig,
 ) -> Path:
@@ -469,6 +635,7 @@ def _write_stamp_debug_artifact(
     return _write_json_artifact(
         input_path=input_path,
         report_dir=report_dir,
+        timestamp=timestamp,
         prefix="stamp_debug",
         payload=payload,
     )
@@ -477,6 +644,7 @@ def _write_stamp_debug_artifact(
 def _write_json_artifact(
     input_path: Path,
     report_dir: Path,
+    timestamp: str,
     prefix: str,
     payload: dict[str, JSONValue],
 ) -> Path:
@@ -485,25 +653,65 @@ def _write_json_artifact(
         input_path=input_path,
         report_dir=report_dir,
         prefix=prefix,
+        timestamp=timestamp,
     )
     candidate.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
     return candidate
 
 
+class _JsonArtifactWriter:
+    """Stream a JSON artifact whose per-page record list arrives incrementally.
+
+    The finished file is byte-for-byte what ``_write_json_artifact`` writes for
+    ``payload`` with the records under ``records_key``, but each record is
+    serialized and written as soon as it is appended.
+    """
+
+    __slots__ = ("_handle", "_path", "_record_count", "_tail")
+
+    def __init__(self, path: Path, payload: dict[str, JSONValue], records_key: str) -> None:
+        # Serialize the fixed fields once around a placeholder, so key order and
+        # indentation come from the same json.dumps call as other artifacts.
+        placeholder = "\0records"
+        text = json.dumps({**payload, records_key: placeholder}, indent=2, sort_keys=True) + "\n"
+        head, self._tail = text.split(json.dumps(placeholder), 1)
+        self._path = path
+        self._record_count = 0
+        self._handle = path.open("w", encoding="utf-8")
+        self._handle.write(head + "[")
+
+    def append(self, record: dict[str, JSONValue]) -> None:
+        separator = ",\n    " if self._record_count else "\n    "
+        body = json.dumps(record, indent=2, sort_keys=True).replace("\n", "\n    ")
+        self._handle.write(separator + body)
+        self._record_count += 1
+
+    def close(self) -> Path:
+        self._handle.write(("\n  ]" if self._record_count else "]") + self._tail)
+        self._handle.close()
+        return self._path
+
+    def discard(self) -> None:
+        self._handle.close()
+        self._path.unlink(missing_ok=True)
+
+
 def _build_timestamped_artifact_path(
     input_path: Path,
     report_dir: Path,
     prefix: str,
+    timestamp: str,
 ) -> Path:
     """Build a unique timestamped artifact path for one processed PDF."""
-    report_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    _ensure_directory(report_dir)
     candidate = report_dir / f"{prefix}_{input_path.stem}_{timestamp}.json"
+    if not candidate.exists():
+        return candidate
+    existing = _casefolded_entry_names(report_dir)
     suffix = 1
-    while candidate.exists():
-        candidate = report_dir / f"{prefix}_{input_path.stem}_{timestamp}_{suffix}.json"
+    while f"{prefix}_{input_path.stem}_{timestamp}_{suffix}.json".casefold() in existing:
         suffix += 1
-    return candidate
+    return report_dir / f"{prefix}_{input_path.stem}_{timestamp}_{suffix}.json"
 
 
 def _stamp_config(config: RunConfig) -> dict[str, JSONValue]:
@@ -6,11 +6,12 @@ from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 import logging
+import threading
 import traceback
 from typing import Iterator
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PyPdfWarningEvent:
     """Structured capture of one pypdf warning log event."""
 
@@ -55,16 +56,19 @@ class PyPdfWarningCollector:
 
 
 class _CollectorHandler(logging.Handler):
-    """Logging handler that stores WARNING+ events into a collector."""
+    """Logging handler that stores WARNING+ events from its own thread."""
 
     def __init__(self, collector: PyPdfWarningCollector) -> None:
         super().__init__(level=logging.WARNING)
         self.collector = collector
+        self.thread_id = threading.get_ident()
 
     def emit(self, record: logging.LogRecord) -> None:
         """Capture the warning event without re-printing it."""
         if record.levelno < logging.WARNING:
             return
+        if record.thread is not None and record.thread != self.thread_id:
+            return
         self.collector.add_from_log_record(record)
 
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from datetime import datetime, timezone
 import getpass
 from pathlib import Path
@@ -148,6 +148,8 @@ def _text_report(run_result: RunResult) -> str:
         f"  strict_xref={run_result.config.strict_xref}",
         f"  debug_render={run_result.config.debug_render}",
         f"  verbose={run_result.config.verbose}",
+        f"  workers={run_result.config.workers}",
+        f"  worker_backend={run_result.config.worker_backend}",
         "",
         "Detection Summary:",
         f"  structural_empty_pages={run_result.totals.get('structural_empty_pages', 0)}",
@@ -218,10 +220,12 @@ def _file_table(files: list[FileResult]) -> str:
 
 
 def _serialize_value(value: Any) -> JSONValue:
+    # Dataclass fields are read directly rather than through asdict(), which
+    # would deep-copy every page decision before this walk converts it again.
     if is_dataclass(value):
         return {
-            str(key): _serialize_value(item)
-            for key, item in asdict(value).items()
+            field.name: _serialize_value(getattr(value, field.name))
+            for field in fields(value)
         }
     if isinstance(value, Path):
         return str(value)
@@ -4,16 +4,14 @@ from __future__ import annotations
 
 from collections.abc import Collection
 from pathlib import Path
-import re
 from typing import Any
 
 from pypdf import PdfReader, PdfWriter
 
+from pdfeditor.discovery import is_edited_pdf_name
 from pdfeditor.models import JSONValue, RewriteResult
 from pdfeditor.stamp_page_numbers import stamp_page_numbers
 
-EDITED_NAME_PATTERN = re.compile(r"\.edited(?:\.\d+)?\.pdf\Z", re.IGNORECASE)
-
 
 def rewrite_pdf(
     input_path: Path,
@@ -21,22 +19,31 @@ def rewrite_pdf(
     pages_to_keep: list[int],
     bookmark_policy: str = "drop",
     stamp_config: dict[str, JSONValue] | None = None,
+    reader: PdfReader | None = None,
 ) -> RewriteResult:
-    """Rewrite a PDF while retaining only the requested page indexes."""
+    """Rewrite a PDF while retaining only the requested page indexes.
+
+    ``reader`` may be an already-open reader for ``input_path``, such as the
+    one used for detection, so the document is not parsed a second time.
+    """
     if bookmark_policy != "drop":
         raise ValueError("Only the 'drop' bookmark policy is supported.")
     _validate_output_path(output_path)
 
-    reader = PdfReader(str(input_path))
+    if reader is None:
+        reader = PdfReader(str(input_path))
     writer = PdfWriter()
     warnings: list[str] = []
 
     keep_list = list(pages_to_keep)
-    full_keep = keep_list == list(range(len(reader.pages)))
+    page_count = len(reader.pages)
+    # The length check settles the common removal case without building a
+    # second index list just to compare against.
+    full_keep = len(keep_list) == page_count and keep_list == list(range(page_count))
     stamp_decisions: list[dict[str, JSONValue]] = []
     if full_keep:
         writer.clone_document_from_reader(reader)
-        pages_output = len(reader.pages)
+        pages_output = page_count
         outlines_copied = 0
         outlines_dropped = 0
     else:
@@ -117,7 +124,7 @@ def rewrite_pdf_removing_pages(
 
 
 def _validate_output_path(output_path: Path) -> None:
-    if not EDITED_NAME_PATTERN.search(output_path.name):
+    if not is_edited_pdf_name(output_path.name):
         raise ValueError(
             "Output path must follow the edited PDF naming scheme "
             "('<stem>.edited.pdf' or '<stem>.edited.<n>.pdf')."
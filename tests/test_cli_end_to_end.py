@@ -102,3 +102,38 @@ def test_cli_render_sample_margin_changes_uat_simple_page_removal(
     assert file_result["status"] == "edited"
     assert file_result["output_path"] == str(expected_output)
     assert file_result["pages_removed"] == expected_removed
+
+
+def test_cli_verbose_prints_status_and_debug_lines_per_file(
+    tmp_path: Path,
+    capsys,
+) -> None:
+    input_dir = tmp_path / "input"
+    report_dir = tmp_path / "reports"
+    input_dir.mkdir()
+
+    write_pdf_with_pages(
+        input_dir / "sample.pdf",
+        page_specs=[text_page("cover"), empty_page()],
+    )
+
+    exit_code = run_cli(
+        [
+            "--verbose",
+            "--mode",
+            "structural",
+            "--debug-structural",
+            "--dry-run",
+            "--path",
+            str(input_dir),
+            "--report-dir",
+            str(report_dir),
+        ]
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+
+    assert exit_code == 0
+    assert lines[0] == f"dry_run: {input_dir / 'sample.pdf'} (removed=1, output={input_dir / 'sample.edited.pdf'})"
+    assert lines[1].startswith(f"wrote structural debug to {report_dir / 'structural_debug_sample_'}")
+    assert lines[2] == "pdfeditor: processed 1 file(s)"
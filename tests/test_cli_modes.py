@@ -121,6 +121,7 @@ def test_cli_render_mode_fails_when_render_backend_missing(
     report_dir = tmp_path / "reports"
     input_dir.mkdir()
 
+    output_dir = tmp_path / "output"
     monkeypatch.setattr("pdfeditor.cli.is_render_backend_available", lambda: False)
 
     exit_code = run_cli(
@@ -129,6 +130,8 @@ def test_cli_render_mode_fails_when_render_backend_missing(
             "render",
             "--path",
             str(input_dir),
+            "--out",
+            str(output_dir),
             "--report-dir",
             str(report_dir),
         ]
@@ -138,5 +141,6 @@ def test_cli_render_mode_fails_when_render_backend_missing(
 
     assert exit_code == 2
     assert "requires optional dependency 'pypdfium2'" in captured.out
+    assert not output_dir.exists()
     payload = json.loads(next(report_dir.glob("run_report_*.json")).read_text(encoding="utf-8"))
     assert payload["errors"]
@@ -0,0 +1,294 @@
+"""CLI tests for parallel per-file processing."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+import dataclasses
+import json
+from pathlib import Path
+import pickle
+
+import pytest
+
+from pdfeditor import cli
+from pdfeditor.cli import build_parser, run_cli
+from pdfeditor.models import RunConfig
+from tests.pdf_factory import empty_page, text_page, write_pdf_with_pages
+
+
+def test_cli_parses_worker_arguments() -> None:
+    args = build_parser().parse_args(["--workers", "3", "--worker-backend", "thread"])
+
+    assert args.workers == 3
+    assert args.worker_backend == "thread"
+
+
+def test_run_config_is_slotted_and_round_trips_through_pickle() -> None:
+    config = RunConfig(
+        path="in",
+        out="out",
+        report_dir="reports",
+        mode="structural",
+        effective_mode="structural",
+        render_dpi=72,
+        ink_threshold=1e-5,
+        background="white",
+        effective_background="white",
+        render_sample_margin=(0.0, 0.0, 0.0, 0.0),
+        white_threshold=240,
+        stamp_page_numbers=False,
+        stamp_page_numbers_force=False,
+        pagenum_box=None,
+        pagenum_size=10.0,
+        pagenum_font="Helvetica",
+        pagenum_format="{page}",
+        recursive=False,
+        write_when_unchanged=False,
+        treat_annotations_as_empty=True,
+        dry_run=False,
+        debug_structural=False,
+        debug_pypdf_xref=False,
+        strict_xref=False,
+        debug_render=False,
+        verbose=False,
+        workers=4,
+    )
+
+    assert not hasattr(config, "__dict__")
+    assert pickle.loads(pickle.dumps(config)) == config
+
+
+def test_cli_rejects_non_positive_workers() -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        run_cli(["--workers", "0"])
+
+    assert exc_info.value.code == 2
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_cli_parallel_workers_keep_discovery_order_and_unique_outputs(
+    tmp_path: Path,
+    backend: str,
+) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    report_dir = tmp_path / "reports"
+    (input_dir / "nested").mkdir(parents=True)
+
+    for name in ("alpha", "beta", "gamma"):
+        write_pdf_with_pages(
+            input_dir / f"{name}.pdf",
+            page_specs=[text_page(name), empty_page()],
+        )
+    write_pdf_with_pages(
+        input_dir / "nested" / "alpha.pdf",
+        page_specs=[empty_page(), text_page("nested alpha")],
+    )
+
+    exit_code = run_cli(
+        [
+            "--mode",
+            "structural",
+            "--recursive",
+            "--workers",
+            "3",
+            "--worker-backend",
+            backend,
+            "--path",
+            str(input_dir),
+            "--out",
+            str(output_dir),
+            "--report-dir",
+            str(report_dir),
+        ]
+    )
+
+    assert exit_code == 0
+    assert sorted(path.name for path in output_dir.glob("*.pdf")) == [
+        "alpha.edited.1.pdf",
+        "alpha.edited.pdf",
+        "beta.edited.pdf",
+        "gamma.edited.pdf",
+    ]
+
+    payload = json.loads(next(report_dir.glob("run_report_*.json")).read_text(encoding="utf-8"))
+    assert [Path(file["input_path"]).relative_to(input_dir).as_posix() for file in payload["files"]] == [
+        "alpha.pdf",
+        "beta.pdf",
+        "gamma.pdf",
+        "nested/alpha.pdf",
+    ]
+    assert payload["config"]["workers"] == 3
+    assert payload["config"]["worker_backend"] == backend
+    assert payload["totals"]["pages_removed_total"] == 4
+
+
+def test_cli_thread_backend_falls_back_to_process_when_pdfium_is_used(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    input_dir = tmp_path / "input"
+    report_dir = tmp_path / "reports"
+    input_dir.mkdir()
+    backends: list[str] = []
+
+    def record_backend(pdf_paths: list[Path], out_dir: Path, config: RunConfig) -> list[object]:
+        backends.append(config.worker_backend)
+        return []
+
+    monkeypatch.setattr(cli, "_iter_file_results", record_backend)
+    monkeypatch.setattr(cli, "is_render_backend_available", lambda: True)
+    common = [
+        "--workers",
+        "2",
+        "--worker-backend",
+        "thread",
+        "--path",
+        str(input_dir),
+        "--report-dir",
+        str(report_dir),
+    ]
+
+    assert run_cli(["--mode", "structural", *common]) == 0
+    assert run_cli(["--mode", "render", *common]) == 0
+    assert run_cli(["--mode", "both", *common]) == 0
+    assert run_cli(["--mode", "structural", "--stamp-page-numbers", "--pagenum-box", "1,1,1,1", *common]) == 0
+
+    assert backends == ["thread", "process", "process", "process"]
+
+
+def test_parallel_file_results_keep_a_bounded_submission_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    submitted: list[list[Path]] = []
+
+    class RecordingExecutor:
+        def __enter__(self) -> "RecordingExecutor":
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            return None
+
+        def submit(self, task: object, group: list[Path]) -> Future[list[str]]:
+            submitted.append(group)
+            future: Future[list[str]] = Future()
+            future.set_result([path.name for path in group])
+            return future
+
+    monkeypatch.setattr(
+        cli,
+        "_build_executor",
+        lambda out_dir, config, max_workers: (RecordingExecutor(), None),
+    )
+    pdf_paths = [Path(f"in/doc{index}.pdf") for index in range(10)] + [Path("in/nested/doc0.pdf")]
+    config = dataclasses.replace(
+        RunConfig(
+            path="in",
+            out="out",
+            report_dir="reports",
+            mode="structural",
+            effective_mode="structural",
+            render_dpi=72,
+            ink_threshold=0.0005,
+            background="white",
+            effective_background="white",
+            render_sample_margin=(0.0, 0.0, 0.0, 0.0),
+            white_threshold=240,
+            stamp_page_numbers=False,
+            stamp_page_numbers_force=False,
+            pagenum_box=None,
+            pagenum_size=10.0,
+            pagenum_font="Helvetica",
+            pagenum_format="{page}",
+            recursive=True,
+            write_when_unchanged=False,
+            treat_annotations_as_empty=True,
+            dry_run=False,
+            debug_structural=False,
+            debug_pypdf_xref=False,
+            strict_xref=False,
+            debug_render=False,
+            verbose=False,
+        ),
+        workers=2,
+    )
+
+    results = cli._iter_file_results(pdf_paths, out_dir=Path("out"), config=config)
+
+    assert next(results) == "doc0.pdf"
+    assert len(submitted) == 2 * 2
+    assert list(results) == [path.name for path in pdf_paths[1:]]
+    assert len(submitted) == 10
+    assert submitted[0] == [Path("in/doc0.pdf"), Path("in/nested/doc0.pdf")]
+
+
+def test_parallel_file_results_report_failed_files_after_pool_breaks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class BreakingExecutor:
+        def __init__(self) -> None:
+            self.submitted = 0
+
+        def __enter__(self) -> "BreakingExecutor":
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            return None
+
+        def submit(self, task: object, group: list[Path]) -> Future[list[str]]:
+            self.submitted += 1
+            if self.submitted > 2:
+                raise BrokenProcessPool("pool is broken")
+            future: Future[list[str]] = Future()
+            if self.submitted == 1:
+                future.set_result([path.name for path in group])
+            else:
+                future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+    monkeypatch.setattr(
+        cli,
+        "_build_executor",
+        lambda out_dir, config, max_workers: (BreakingExecutor(), None),
+    )
+    pdf_paths = [Path(f"in/doc{index}.pdf") for index in range(5)]
+    config = dataclasses.replace(
+        RunConfig(
+            path="in",
+            out="out",
+            report_dir="reports",
+            mode="structural",
+            effective_mode="structural",
+            render_dpi=72,
+            ink_threshold=0.0005,
+            background="white",
+            effective_background="white",
+            render_sample_margin=(0.0, 0.0, 0.0, 0.0),
+            white_threshold=240,
+            stamp_page_numbers=False,
+            stamp_page_numbers_force=False,
+            pagenum_box=None,
+            pagenum_size=10.0,
+            pagenum_font="Helvetica",
+            pagenum_format="{page}",
+            recursive=False,
+            write_when_unchanged=False,
+            treat_annotations_as_empty=True,
+            dry_run=False,
+            debug_structural=False,
+            debug_pypdf_xref=False,
+            strict_xref=False,
+            debug_render=False,
+            verbose=False,
+        ),
+        workers=2,
+    )
+
+    results = list(cli._iter_file_results(pdf_paths, out_dir=Path("out"), config=config))
+
+    assert results[0] == "doc0.pdf"
+    assert [result.input_path for result in results[1:]] == [str(path) for path in pdf_paths[1:]]
+    assert all(result.status == "failed" for result in results[1:])
+    assert results[1].errors == ["worker_error: worker died"]
+    assert results[4].errors == ["worker_error: pool is broken"]
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 import pytest
-from pypdf import PdfReader
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject, NumberObject
 
 pypdf = pytest.importorskip("pypdf", reason="pypdf is required for PDF factory tests")
 
-from pdfeditor.detect_empty import detect_empty_pages, is_page_empty_structural
+from pdfeditor import detect_empty
+from pdfeditor.detect_empty import (
+    _is_comment_or_whitespace_only,
+    detect_empty_pages,
+    detect_page_decisions,
+    is_page_empty_structural,
+)
 from tests.pdf_factory import (
     annotation_only_page,
     create_pdf_with_pages,
@@ -17,6 +27,7 @@ from tests.pdf_factory import (
     font_resources_only_page,
     footer_page_number_page,
     invisible_text_tr3_page,
+    shape_page,
     state_ops_only_page,
     text_page,
     whitespace_only_page,
@@ -134,3 +145,211 @@ def test_invisible_text_tr3_page_is_empty_and_recorded_as_invisible_paint() -> N
     assert reason == "only_invisible_paint"
     assert details["invisible_text_events_count"] == 1
     assert details["last_seen_Tr"] == 3
+
+
+def test_comment_or_whitespace_probe_skips_comments_and_all_whitespace() -> None:
+    content = b"% header comment\r\n q\t1 0 0 1 0 0 cm\x0cQ % trailing\nBT\x85ET\xa0%eof"
+
+    assert not _is_comment_or_whitespace_only(content)
+    assert _is_comment_or_whitespace_only(b" \r\n\t% only a comment\n\x0c\x85\xa0%eof")
+    assert _is_comment_or_whitespace_only(b"")
+    assert not _is_comment_or_whitespace_only(b"% comment\n\x00")
+    assert _is_comment_or_whitespace_only(b" \t\r\n\x0c\x1c\x85\xa0")
+    assert not _is_comment_or_whitespace_only(b" \n\x00\n ")
+
+
+def test_parallel_page_decisions_match_sequential_in_page_order() -> None:
+    pdf_bytes = create_pdf_with_pages(
+        [
+            empty_page(),
+            text_page("1"),
+            state_ops_only_page(),
+            invisible_text_tr3_page(),
+            shape_page(),
+            whitespace_only_page(),
+        ]
+    )
+    reader = PdfReader(BytesIO(pdf_bytes))
+    sequential_records: list[dict[str, object]] = []
+    parallel_records: list[dict[str, object]] = []
+
+    sequential = detect_page_decisions(reader, True, debug_sink=sequential_records.append)
+    parallel = detect_page_decisions(
+        reader,
+        True,
+        debug_sink=parallel_records.append,
+        max_workers=2,
+    )
+
+    assert parallel == sequential
+    assert parallel_records == sequential_records
+    assert detect_empty_pages(pdf_bytes, max_workers=2) == [decision.is_empty for decision in sequential]
+
+
+def test_parallel_page_decisions_stay_serial_for_short_documents(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_pool(*args: object, **kwargs: object) -> None:
+        raise AssertionError("short documents should not start a process pool")
+
+    monkeypatch.setattr(detect_empty, "ProcessPoolExecutor", fail_pool)
+    pdf_bytes = create_pdf_with_pages([empty_page(), text_page("1"), empty_page()])
+
+    decisions = detect_page_decisions(PdfReader(BytesIO(pdf_bytes)), True, max_workers=4)
+
+    assert [decision.is_empty for decision in decisions] == [True, False, True]
+    assert detect_empty_pages(pdf_bytes, max_workers=4) == [True, False, True]
+
+
+def test_bytes_operator_dispatch_records_decoded_operator_names() -> None:
+    writer = PdfWriter(clone_from=BytesIO(create_pdf_with_pages([empty_page()])))
+    page = writer.pages[0]
+    stream = DecodedStreamObject()
+    stream.set_data(b"q 1 0 0 1 0 0 cm 0 g 0 0 10 10 re n Q BI /W 1 /H 1 /CS /G /BPC 8 ID \x00 EI")
+    page.replace_contents(stream)
+
+    is_empty, reason, details = is_page_empty_structural(page, treat_annotations_as_empty=True)
+
+    assert is_empty is False
+    assert reason == "inline_image"
+    assert details["state_ops_found"] == ["q", "cm", "g", "re", "n", "Q"]
+    assert details["paint_ops_found"] == ["BI"]
+
+
+@pytest.mark.parametrize("treat_annotations_as_empty", [True, False])
+def test_lean_detection_matches_full_decisions(treat_annotations_as_empty: bool) -> None:
+    pdf_bytes = create_pdf_with_pages(
+        [
+            empty_page(),
+            annotation_only_page(),
+            text_page("1"),
+            state_ops_only_page(),
+            invisible_text_tr3_page(),
+            whitespace_only_page(),
+            shape_page(),
+        ]
+    )
+    reader = PdfReader(BytesIO(pdf_bytes))
+
+    for page in reader.pages:
+        full = is_page_empty_structural(page, treat_annotations_as_empty=treat_annotations_as_empty)
+        lean = is_page_empty_structural(
+            page,
+            treat_annotations_as_empty=treat_annotations_as_empty,
+            collect_details=False,
+        )
+        assert lean[:2] == full[:2]
+
+    assert detect_empty_pages(pdf_bytes, treat_annotations_as_empty=treat_annotations_as_empty) == [
+        is_page_empty_structural(page, treat_annotations_as_empty=treat_annotations_as_empty)[0]
+        for page in reader.pages
+    ]
+
+
+def test_detect_empty_pages_reader_cache_is_opt_in_and_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    constructed: list[object] = []
+    original_reader = detect_empty.PdfReader
+
+    def counting_reader(stream: BytesIO) -> PdfReader:
+        reader = original_reader(stream)
+        constructed.append(reader)
+        return reader
+
+    monkeypatch.setattr(detect_empty, "PdfReader", counting_reader)
+    monkeypatch.setattr(detect_empty, "_READER_CACHE_POOL", threading.local())
+    monkeypatch.setattr(detect_empty, "_READER_CACHE_MAX", 1)
+    first = create_pdf_with_pages([empty_page(), text_page("1")])
+    second = create_pdf_with_pages([text_page("2")])
+
+    assert detect_empty_pages(first) == [True, False]
+    assert detect_empty_pages(first) == [True, False]
+    assert len(constructed) == 2
+
+    assert detect_empty_pages(first, use_cache=True) == [True, False]
+    assert detect_empty_pages(first, use_cache=True) == [True, False]
+    assert len(constructed) == 3
+
+    assert detect_empty_pages(second, use_cache=True) == [False]
+    assert detect_empty_pages(first, use_cache=True) == [True, False]
+    assert len(constructed) == 5
+    assert len(detect_empty._reader_cache()) == 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(detect_empty_pages, first, use_cache=True).result() == [True, False]
+    assert len(constructed) == 6
+
+
+def test_last_seen_state_reflects_operator_that_ended_the_scan() -> None:
+    writer = PdfWriter(clone_from=BytesIO(create_pdf_with_pages([text_page("1")])))
+    page = writer.pages[0]
+    stream = DecodedStreamObject()
+    stream.set_data(b"BT 3 Tr /F1 0 Tf (a) Tj 2 Tr /F1 9 Tf (b) Tj 0 Tr /F1 5 Tf (c) Tj ET")
+    page.replace_contents(stream)
+
+    is_empty, reason, details = is_page_empty_structural(page, treat_annotations_as_empty=True)
+
+    assert (is_empty, reason) == (False, "visible_text")
+    assert details["last_seen_Tr"] == 2
+    assert details["last_seen_font_size"] == 9.0
+    assert details["paint_ops_found"] == ["Tj", "Tj"]
+
+
+def test_pooled_evaluation_context_does_not_leak_state_between_pages() -> None:
+    writer = PdfWriter(clone_from=BytesIO(create_pdf_with_pages([text_page("1"), text_page("2")])))
+    first_stream = DecodedStreamObject()
+    first_stream.set_data(b"q q BT 3 Tr /F1 12 Tf (hidden) Tj ET")
+    writer.pages[0].replace_contents(first_stream)
+
+    first = is_page_empty_structural(writer.pages[0], treat_annotations_as_empty=True)
+    second = is_page_empty_structural(writer.pages[1], treat_annotations_as_empty=True)
+
+    assert first[:2] == (True, "only_invisible_paint")
+    assert second[:2] == (False, "visible_text")
+    assert second[2]["last_seen_Tr"] == 0
+    assert second[2]["paint_ops_seen_count"] == 1
+    assert "graphics_state_underflow" not in second[2]["notes"]
+    assert detect_empty._CONTEXT_POOL.context.extgstate_resources is None
+
+
+def test_lean_quick_path_defers_malformed_resources_to_full_path() -> None:
+    writer = PdfWriter(clone_from=BytesIO(create_pdf_with_pages([empty_page(), empty_page()])))
+    malformed, blank = writer.pages
+    malformed[NameObject("/Resources")] = DictionaryObject(
+        {
+            NameObject("/Font"): NumberObject(1),
+            NameObject("/XObject"): DictionaryObject({NameObject("/Im0"): DictionaryObject()}),
+        }
+    )
+
+    full = is_page_empty_structural(malformed, treat_annotations_as_empty=True)
+    lean = is_page_empty_structural(malformed, treat_annotations_as_empty=True, collect_details=False)
+
+    assert full[:2] == lean[:2] == (False, "unknown_structure")
+    assert is_page_empty_structural(blank, treat_annotations_as_empty=True, collect_details=False) == (
+        True,
+        "no_contents",
+        {},
+    )
+
+
+@pytest.mark.parametrize("treat_annotations_as_empty", [True, False])
+def test_lean_path_keeps_malformed_annotations_conservative(treat_annotations_as_empty: bool) -> None:
+    writer = PdfWriter(clone_from=BytesIO(create_pdf_with_pages([empty_page()])))
+    page = writer.pages[0]
+    page[NameObject("/Annots")] = NumberObject(7)
+
+    full = is_page_empty_structural(page, treat_annotations_as_empty=treat_annotations_as_empty)
+    lean = is_page_empty_structural(
+        page,
+        treat_annotations_as_empty=treat_annotations_as_empty,
+        collect_details=False,
+    )
+
+    assert full[:2] == lean[:2] == (False, "unknown_structure")
+
+
+def test_page_decisions_are_slotted_and_picklable() -> None:
+    reader = PdfReader(BytesIO(create_pdf_with_pages([empty_page(), text_page("Visible")])))
+
+    decisions = detect_page_decisions(reader, treat_annotations_as_empty=True)
+
+    assert not hasattr(decisions[0], "__dict__")
+    assert pickle.loads(pickle.dumps(decisions)) == decisions
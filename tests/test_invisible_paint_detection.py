@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from io import BytesIO
 
-from pypdf import PdfReader
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject
 
-from pdfeditor.detect_empty import detect_page_decisions
+from pdfeditor.detect_empty import detect_page_decisions, is_page_empty_structural
 from tests.pdf_factory import (
     create_pdf_with_pages,
     invisible_text_opacity_zero_page,
@@ -38,3 +39,23 @@ def test_invisible_paint_pages_are_empty_but_visible_text_is_not() -> None:
     assert decisions[2].reason == "only_invisible_paint"
     assert decisions[3].is_empty is False
     assert decisions[3].reason == "visible_text"
+
+
+def test_repeated_extgstate_names_apply_cached_opacity_each_time() -> None:
+    writer = PdfWriter(clone_from=BytesIO(create_pdf_with_pages([invisible_text_opacity_zero_page()])))
+    page = writer.pages[0]
+    stream = DecodedStreamObject()
+    stream.set_data(
+        b"/GS0 gs BT /F1 12 Tf 72 720 Td (A) Tj ET "
+        b"q /GS0 gs /Missing gs BT /F1 12 Tf 72 700 Td (B) Tj ET Q "
+        b"/Missing gs /GS0 gs BT /F1 12 Tf 72 680 Td (C) Tj ET"
+    )
+    page.replace_contents(stream)
+
+    is_empty, reason, details = is_page_empty_structural(page, treat_annotations_as_empty=True)
+
+    assert is_empty is True
+    assert reason == "only_invisible_paint"
+    assert details["extgstate_hits"] == ["/GS0", "/GS0", "/Missing", "/Missing", "/GS0"]
+    assert details["notes"] == ["unknown_extgstate", "unknown_extgstate"]
+    assert details["invisible_text_events_count"] == 3
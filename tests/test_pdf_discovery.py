@@ -0,0 +1,64 @@
+"""Tests for PDF input discovery."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pdfeditor.discovery import discover_pdfs, is_edited_pdf_name
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"%PDF-1.4\n")
+    return path
+
+
+def test_discover_pdfs_filters_edited_outputs_and_non_pdfs(tmp_path: Path) -> None:
+    _touch(tmp_path / "b.pdf")
+    _touch(tmp_path / "A.PDF")
+    _touch(tmp_path / "notes.txt")
+    _touch(tmp_path / ".pdf")
+    _touch(tmp_path / "b.edited.pdf")
+    _touch(tmp_path / "b.EDITED.2.pdf")
+    (tmp_path / "folder.pdf").mkdir()
+    _touch(tmp_path / "nested" / "c.pdf")
+
+    assert discover_pdfs(tmp_path, recursive=False) == [
+        tmp_path / "A.PDF",
+        tmp_path / "b.pdf",
+    ]
+
+
+def test_discover_pdfs_recursive_returns_sorted_nested_candidates(tmp_path: Path) -> None:
+    _touch(tmp_path / "z.pdf")
+    _touch(tmp_path / "nested" / "deeper" / "c.pdf")
+    _touch(tmp_path / "nested" / "a.pdf")
+    _touch(tmp_path / "nested" / "a.edited.1.pdf")
+    _touch(tmp_path / "folder.pdf" / "inner.pdf")
+
+    assert discover_pdfs(tmp_path, recursive=True) == [
+        tmp_path / "folder.pdf" / "inner.pdf",
+        tmp_path / "nested" / "a.pdf",
+        tmp_path / "nested" / "deeper" / "c.pdf",
+        tmp_path / "z.pdf",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("report.edited.pdf", True),
+        ("report.Edited.PDF", True),
+        ("report.edited.12.pdf", True),
+        ("report.pdf", False),
+        ("report.edited.pdf.pdf", False),
+        ("report.edited..pdf", False),
+        ("report.edited.1a.pdf", False),
+        ("report_edited.pdf", False),
+        ("report.edited.txt", False),
+    ],
+)
+def test_is_edited_pdf_name_matches_edited_suffixes(name: str, expected: bool) -> None:
+    assert is_edited_pdf_name(name) is expected
@@ -6,6 +6,7 @@ import logging
 
 import pytest
 
+from pdfeditor.cli import _configure_pypdf_logging
 from pdfeditor.pypdf_debug import (
     PyPdfWarningCollector,
     capture_pypdf_warnings,
@@ -33,3 +34,16 @@ def test_ensure_no_pypdf_warnings_raises_in_strict_mode() -> None:
 
     with pytest.raises(ValueError, match="pypdf_xref_warning"):
         ensure_no_pypdf_warnings(collector)
+
+
+def test_configure_pypdf_logging_disables_records_without_capture() -> None:
+    logger = logging.getLogger("pypdf")
+    previous_level = logger.level
+    try:
+        _configure_pypdf_logging(capture_warnings=False)
+        assert not logger.isEnabledFor(logging.CRITICAL)
+
+        _configure_pypdf_logging(capture_warnings=True)
+        assert logger.isEnabledFor(logging.WARNING)
+    finally:
+        logger.setLevel(previous_level)
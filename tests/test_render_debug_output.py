@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 from pathlib import Path
 
@@ -25,7 +26,25 @@ def test_process_pdf_writes_render_debug_artifact(tmp_path: Path) -> None:
         page_specs=[empty_page(), text_page("Visible text")],
     )
 
-    config = RunConfig(
+    config = _render_debug_config(input_dir, out_dir, report_dir)
+
+    result = process_pdf(input_path=input_path, out_dir=out_dir, config=config)
+
+    assert result.render_debug_path is not None
+    debug_path = Path(result.render_debug_path)
+    assert debug_path.exists()
+
+    payload = json.loads(debug_path.read_text(encoding="utf-8"))
+    assert payload["render_parameters"]["white_threshold"] == 250
+    assert payload["render_parameters"]["render_sample_margin"] == [0.25, 0.25, 0.25, 0.25]
+    assert len(payload["per_page"]) == 2
+    assert payload["per_page"][0]["sample_margin_inches"] == [0.25, 0.25, 0.25, 0.25]
+    assert "sample_box_px" in payload["per_page"][0]
+    assert payload["per_page"][0]["ink_ratio"] <= payload["per_page"][1]["ink_ratio"]
+
+
+def _render_debug_config(input_dir: Path, out_dir: Path, report_dir: Path) -> RunConfig:
+    return RunConfig(
         path=str(input_dir),
         out=str(out_dir),
         report_dir=str(report_dir),
@@ -54,16 +73,39 @@ def test_process_pdf_writes_render_debug_artifact(tmp_path: Path) -> None:
         verbose=False,
     )
 
+
+@pytest.mark.parametrize(
+    ("mode", "empty_reason"),
+    [("both", "both_empty"), ("render", "render_empty")],
+)
+def test_process_pdf_overlaps_detectors_with_full_results(
+    tmp_path: Path,
+    mode: str,
+    empty_reason: str,
+) -> None:
+    input_dir = tmp_path / "input"
+    out_dir = tmp_path / "output"
+    report_dir = tmp_path / "reports"
+    input_dir.mkdir()
+    input_path = write_pdf_with_pages(
+        input_dir / "sample.pdf",
+        page_specs=[empty_page(), text_page("Visible text")],
+    )
+    config = dataclasses.replace(
+        _render_debug_config(input_dir, out_dir, report_dir),
+        mode=mode,
+        effective_mode=mode,
+        debug_structural=True,
+    )
+
     result = process_pdf(input_path=input_path, out_dir=out_dir, config=config)
 
+    assert [decision.reason for decision in result.page_decisions] == [empty_reason, "non_empty"]
+    assert result.page_decisions[0].details["structural_is_empty"] is True
+    assert result.structural_debug_path is not None
     assert result.render_debug_path is not None
-    debug_path = Path(result.render_debug_path)
-    assert debug_path.exists()
-
-    payload = json.loads(debug_path.read_text(encoding="utf-8"))
-    assert payload["render_parameters"]["white_threshold"] == 250
-    assert payload["render_parameters"]["render_sample_margin"] == [0.25, 0.25, 0.25, 0.25]
-    assert len(payload["per_page"]) == 2
-    assert payload["per_page"][0]["sample_margin_inches"] == [0.25, 0.25, 0.25, 0.25]
-    assert "sample_box_px" in payload["per_page"][0]
-    assert payload["per_page"][0]["ink_ratio"] <= payload["per_page"][1]["ink_ratio"]
+    render_payload = json.loads(Path(result.render_debug_path).read_text(encoding="utf-8"))
+    assert len(render_payload["per_page"]) == 2
+    assert {"detection_structural_seconds", "detection_render_seconds", "detection_seconds"} <= set(
+        result.timings
+    )
@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 pytest.importorskip("pypdfium2", reason="Optional render detector requires pypdfium2")
 
-from pdfeditor.detect_render import detect_empty_pages_render
+from pdfeditor.detect_render import (
+    _ReusableBitmapMaker,
+    _load_pdfium,
+    _measure_ink_ratio,
+    detect_empty_pages_render,
+    get_render_backend_version,
+    is_render_backend_available,
+)
 from tests.pdf_factory import empty_page, text_page, write_pdf_with_pages
 
 
+def test_render_backend_probe_is_cached() -> None:
+    assert is_render_backend_available() is True
+    assert is_render_backend_available() is True
+    assert is_render_backend_available.cache_info().hits >= 1
+
+
+def test_render_backend_module_is_resolved_once() -> None:
+    assert _load_pdfium() is _load_pdfium()
+    assert get_render_backend_version() == get_render_backend_version()
+    assert _load_pdfium.cache_info().currsize == 1
+
+
 def test_render_detector_flags_blank_page_and_visible_text(tmp_path: Path) -> None:
     pdf_path = write_pdf_with_pages(
         tmp_path / "render-sample.pdf",
@@ -50,3 +70,224 @@ def test_render_detector_marks_invalid_sample_area_non_empty(tmp_path: Path) ->
     assert len(decisions) == 1
     assert decisions[0].is_empty is False
     assert decisions[0].reason == "invalid_sample_area"
+
+
+def test_ink_measurement_honors_stride_padding_alpha_and_sample_box() -> None:
+    white = bytes([255, 255, 255, 255])
+    ink = bytes([10, 200, 250, 255])
+    transparent_ink = bytes([0, 0, 0, 0])
+    padding = bytes([0, 0])
+    rows = [
+        ink + white + white + padding,
+        white + ink + transparent_ink + padding,
+        white + white + ink + padding,
+    ]
+    bitmap = SimpleNamespace(
+        width=3,
+        height=3,
+        stride=14,
+        n_channels=4,
+        buffer=b"".join(rows),
+    )
+
+    diagnostics = _measure_ink_ratio(
+        bitmap=bitmap,
+        background="white",
+        dpi=72,
+        sample_margin_inches=(0.0, 1 / 72, 0.0, 0.0),
+        white_threshold=240,
+    ).diagnostics
+
+    assert diagnostics is not None
+    assert diagnostics["sample_box_px"] == [1, 0, 3, 3]
+    assert diagnostics["sampled_pixel_count"] == 6
+    assert diagnostics["nonwhite_pixel_count"] == 2
+    assert diagnostics["min_rgb"] == [0, 0, 0]
+    assert diagnostics["max_rgb"] == [255, 255, 255]
+    assert diagnostics["min_alpha"] == 0
+    assert diagnostics["max_alpha"] == 255
+
+
+def test_render_detector_parallel_matches_sequential_in_page_order(tmp_path: Path) -> None:
+    pdf_path = write_pdf_with_pages(
+        tmp_path / "render-parallel.pdf",
+        page_specs=[empty_page(), text_page("One"), empty_page(), text_page("Two"), empty_page()],
+    )
+    sequential_records: list[dict[str, object]] = []
+    parallel_records: list[dict[str, object]] = []
+
+    sequential = detect_empty_pages_render(
+        input_path=pdf_path,
+        dpi=36,
+        ink_threshold=0.0005,
+        debug_sink=sequential_records.append,
+    )
+    parallel = detect_empty_pages_render(
+        input_path=pdf_path,
+        dpi=36,
+        ink_threshold=0.0005,
+        debug_sink=parallel_records.append,
+        max_workers=2,
+    )
+
+    assert parallel == sequential
+    assert parallel_records == sequential_records
+    assert [decision.is_empty for decision in parallel] == [True, False, True, False, True]
+
+
+def test_ink_measurement_skips_diagnostics_when_not_requested() -> None:
+    bitmap = SimpleNamespace(
+        width=2,
+        height=1,
+        stride=6,
+        n_channels=3,
+        buffer=bytes([255, 255, 255, 0, 0, 0]),
+    )
+    measure = {
+        "bitmap": bitmap,
+        "background": "white",
+        "dpi": 72,
+        "sample_margin_inches": (0.0, 0.0, 0.0, 0.0),
+        "white_threshold": 240,
+    }
+
+    full = _measure_ink_ratio(**measure)
+    lean = _measure_ink_ratio(**measure, collect_diagnostics=False)
+
+    assert lean.ink_ratio == full.ink_ratio == 0.5
+    assert lean.sampled_pixel_count == full.sampled_pixel_count == 2
+    assert lean.sample_box_px == full.sample_box_px == (0, 0, 2, 1)
+    assert full.diagnostics is not None
+    assert full.diagnostics["nonwhite_pixel_count"] == 1
+    assert full.diagnostics["min_rgb"] == [0, 0, 0]
+    assert lean.diagnostics is None
+
+
+def test_reusable_bitmap_maker_shares_one_buffer_across_pages() -> None:
+    pdfium = pytest.importorskip("pypdfium2")
+    document = pdfium.PdfDocument.new()
+    document.new_page(72, 72)
+    document.new_page(36, 36)
+    bitmap_maker = _ReusableBitmapMaker(pdfium)
+
+    first = document[0].render(scale=1, bitmap_maker=bitmap_maker)
+    first_buffer = first.buffer
+    first.close()
+    second = document[1].render(scale=1, bitmap_maker=bitmap_maker)
+
+    assert second.buffer is first_buffer
+    assert (second.width, second.height) == (36, 36)
+    second.close()
+    document.close()
+
+
+def test_render_detector_renders_only_candidate_pages(tmp_path: Path) -> None:
+    pdf_path = write_pdf_with_pages(
+        tmp_path / "render-candidates.pdf",
+        page_specs=[empty_page(), text_page("Visible text"), empty_page()],
+    )
+    records: list[dict[str, object]] = []
+
+    decisions = detect_empty_pages_render(
+        input_path=pdf_path,
+        dpi=36,
+        ink_threshold=0.0005,
+        debug_sink=records.append,
+        candidate_pages=[1, 2],
+    )
+
+    assert [decision.reason for decision in decisions] == [
+        "skipped_by_prefilter",
+        "ink_above_threshold",
+        "ink_below_threshold",
+    ]
+    assert decisions[0].is_empty is False
+    assert decisions[0].details["ink_ratio"] is None
+    assert [record["reason"] for record in records] == [decision.reason for decision in decisions]
+
+
+def test_render_screening_only_settles_clearly_inked_pages(tmp_path: Path) -> None:
+    pdf_path = write_pdf_with_pages(
+        tmp_path / "render-screening.pdf",
+        page_specs=[empty_page(), text_page("Visible text")],
+    )
+
+    decisions = detect_empty_pages_render(
+        input_path=pdf_path,
+        dpi=144,
+        ink_threshold=0.0005,
+        screening_dpi=36,
+    )
+
+    blank, inked = decisions
+    assert blank.is_empty is True
+    assert blank.details["dpi"] == 144
+    assert blank.details["screening_ink_ratio"] == 0.0
+    assert inked.is_empty is False
+    assert inked.details["dpi"] == 36
+    assert inked.details["screening_ink_ratio"] == inked.details["ink_ratio"]
+
+
+def test_ink_measurement_sample_step_reads_every_nth_pixel_and_row() -> None:
+    white = bytes([255, 255, 255])
+    ink = bytes([0, 0, 0])
+    rows = [
+        ink + white + ink,
+        ink + ink + ink,
+        white + white + ink,
+    ]
+    bitmap = SimpleNamespace(width=3, height=3, stride=9, n_channels=3, buffer=b"".join(rows))
+
+    diagnostics = _measure_ink_ratio(
+        bitmap=bitmap,
+        background="white",
+        dpi=72,
+        sample_margin_inches=(0.0, 0.0, 0.0, 0.0),
+        white_threshold=240,
+        sample_step=2,
+    ).diagnostics
+
+    assert diagnostics is not None
+    assert diagnostics["sampled_pixel_count"] == 4
+    assert diagnostics["nonwhite_pixel_count"] == 3
+    assert diagnostics["ink_ratio"] == 0.75
+
+
+def test_render_detector_streams_decisions_to_sink(tmp_path: Path) -> None:
+    pdf_path = write_pdf_with_pages(
+        tmp_path / "render-sink.pdf",
+        page_specs=[empty_page(), text_page("One"), empty_page(), text_page("Two")],
+    )
+    expected = detect_empty_pages_render(input_path=pdf_path, dpi=36, ink_threshold=0.0005)
+
+    for max_workers in (None, 2):
+        streamed: list[object] = []
+        result = detect_empty_pages_render(
+            input_path=pdf_path,
+            dpi=36,
+            ink_threshold=0.0005,
+            max_workers=max_workers,
+            decision_sink=streamed.append,
+        )
+
+        assert result is None
+        assert streamed == expected
+
+
+def test_render_detector_loads_in_memory_source(tmp_path: Path) -> None:
+    pdf_path = write_pdf_with_pages(
+        tmp_path / "render-source.pdf",
+        page_specs=[empty_page(), text_page("Visible text")],
+    )
+    expected = detect_empty_pages_render(input_path=pdf_path, dpi=36, ink_threshold=0.0005)
+    source = pdf_path.read_bytes()
+    pdf_path.unlink()
+
+    decisions = detect_empty_pages_render(
+        input_path=pdf_path,
+        dpi=36,
+        ink_threshold=0.0005,
+        source=source,
+    )
+
+    assert decisions == expected
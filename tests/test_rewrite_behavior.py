@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import dataclasses
 from pathlib import Path
 
+import pytest
 from pypdf import PdfReader
 
+from pdfeditor import rewrite
 from pdfeditor.models import RunConfig
-from pdfeditor.processor import process_pdf
+from pdfeditor.processor import _build_timestamped_artifact_path, build_output_path, process_pdf
 from pdfeditor.rewrite import rewrite_pdf_removing_pages
 from tests.pdf_factory import empty_page, text_page, write_pdf_with_pages
 
@@ -30,7 +33,10 @@ def test_rewrite_removes_empty_middle_page_and_uses_suffix(tmp_path: Path) -> No
     assert len(reader.pages) == 2
 
 
-def test_process_pdf_uses_numeric_suffix_when_output_exists(tmp_path: Path) -> None:
+def test_process_pdf_uses_numeric_suffix_when_output_exists(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     input_dir = tmp_path / "input"
     out_dir = tmp_path / "output"
     report_dir = tmp_path / "reports"
@@ -75,9 +81,64 @@ def test_process_pdf_uses_numeric_suffix_when_output_exists(tmp_path: Path) -> N
         verbose=False,
     )
 
+    def reopen_not_expected(*args: object, **kwargs: object) -> PdfReader:
+        raise AssertionError("rewrite should reuse the detection reader")
+
+    monkeypatch.setattr(rewrite, "PdfReader", reopen_not_expected)
     result = process_pdf(input_path=input_path, out_dir=out_dir, config=config)
 
     assert result.status == "edited"
+    assert len(PdfReader(result.output_path).pages) == 2
     assert result.output_path is not None
     assert result.output_path.endswith("sample.edited.1.pdf")
     assert any("already existed" in warning for warning in result.warnings)
+
+    unchanged_path = write_pdf_with_pages(
+        input_dir / "unchanged.pdf",
+        page_specs=[text_page("cover"), text_page("appendix")],
+    )
+    unchanged = process_pdf(
+        input_path=unchanged_path,
+        out_dir=out_dir,
+        config=dataclasses.replace(config, write_when_unchanged=True),
+    )
+
+    assert unchanged.status == "copied"
+    assert unchanged.pages_output == 2
+    assert unchanged.output_path is not None
+    copied_path = Path(unchanged.output_path)
+    assert copied_path.name == "unchanged.edited.pdf"
+    assert copied_path.read_bytes() == unchanged_path.read_bytes()
+    assert copied_path.stat().st_ino != unchanged_path.stat().st_ino
+    assert "write_seconds" in unchanged.timings
+
+    assert result.output_path is not None
+    assert result.output_path.endswith("sample.edited.1.pdf")
+    assert any("already existed" in warning for warning in result.warnings)
+
+
+def test_output_and_artifact_paths_skip_every_taken_suffix(tmp_path: Path) -> None:
+    for name in ("doc.edited.pdf", "doc.edited.1.pdf", "DOC.EDITED.2.pdf", "doc.edited.4.pdf"):
+        (tmp_path / name).touch()
+
+    output_path, warnings = build_output_path(input_path=Path("in/doc.pdf"), out_dir=tmp_path)
+
+    assert output_path == tmp_path / "doc.edited.3.pdf"
+    assert warnings == ["Output path already existed; wrote to 'doc.edited.3.pdf' instead."]
+
+    paths = []
+    for _ in range(3):
+        path = _build_timestamped_artifact_path(
+            Path("in/doc.pdf"),
+            report_dir=tmp_path,
+            prefix="debug",
+            timestamp="20240101_120000",
+        )
+        path.touch()
+        paths.append(path.name)
+
+    assert paths == [
+        "debug_doc_20240101_120000.json",
+        "debug_doc_20240101_120000_1.json",
+        "debug_doc_20240101_120000_2.json",
+    ]
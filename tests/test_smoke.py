@@ -1,5 +1,23 @@
+import subprocess
+import sys
+
 import pdfeditor
 
 
 def test_version_exists() -> None:
     assert pdfeditor.__version__ == "1.0.0"
+
+
+def test_cli_import_defers_pdf_libraries() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pdfeditor.cli; print('pypdf' in sys.modules, 'pypdfium2' in sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "False False"
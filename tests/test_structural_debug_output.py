@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import dataclasses
+import hashlib
+from io import BytesIO
 import json
 from pathlib import Path
 
+import pytest
+from pypdf import PdfReader
+
+from pdfeditor import detect_empty
 from pdfeditor.models import RunConfig
-from pdfeditor.processor import process_pdf
-from tests.pdf_factory import empty_page, text_page, write_pdf_with_pages
+from pdfeditor.processor import _JsonArtifactWriter, process_pdf
+from tests.pdf_factory import create_pdf_with_pages, empty_page, text_page, write_pdf_with_pages
 
 
 def test_process_pdf_writes_structural_debug_artifact(tmp_path: Path) -> None:
@@ -56,7 +63,9 @@ def test_process_pdf_writes_structural_debug_artifact(tmp_path: Path) -> None:
     debug_path = Path(result.structural_debug_path)
     assert debug_path.exists()
 
-    payload = json.loads(debug_path.read_text(encoding="utf-8"))
+    debug_text = debug_path.read_text(encoding="utf-8")
+    payload = json.loads(debug_text)
+    assert debug_text == json.dumps(payload, indent=2, sort_keys=True) + "\n"
     assert payload["input_path"] == str(input_path)
     assert isinstance(payload["pages"], list)
     assert len(payload["pages"]) == 2
@@ -89,3 +98,110 @@ def test_process_pdf_writes_structural_debug_artifact(tmp_path: Path) -> None:
         "gs_events",
         "parsing_exceptions",
     }.issubset(operator_summary)
+
+
+def test_json_artifact_writer_matches_whole_payload_dump(tmp_path: Path) -> None:
+    records = [{"b": [], "a": {"nested": "line\nbreak"}}, {"c": 1.5}]
+    for count in (0, 1, 2):
+        writer = _JsonArtifactWriter(
+            path=tmp_path / f"artifact_{count}.json",
+            payload={"z_parameters": {"dpi": 72}, "input_path": "in.pdf"},
+            records_key="per_page",
+        )
+        for record in records[:count]:
+            writer.append(record)
+        path = writer.close()
+
+        expected = {"z_parameters": {"dpi": 72}, "input_path": "in.pdf", "per_page": records[:count]}
+        assert path.read_text(encoding="utf-8") == json.dumps(expected, indent=2, sort_keys=True) + "\n"
+
+    discarded = _JsonArtifactWriter(path=tmp_path / "partial.json", payload={}, records_key="pages")
+    discarded.append({"page_index_0": 0})
+    discarded.discard()
+    assert not (tmp_path / "partial.json").exists()
+
+
+def test_stream_debug_work_only_runs_with_a_debug_sink(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def record_call(name: str, original):  # type: ignore[no-untyped-def]
+        def wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
+            calls.append(name)
+            return original(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        detect_empty,
+        "_merge_content_stream_debug",
+        record_call("merge", detect_empty._merge_content_stream_debug),
+    )
+    monkeypatch.setattr(
+        detect_empty,
+        "_build_operator_summary",
+        record_call("summary", detect_empty._build_operator_summary),
+    )
+    reader = PdfReader(BytesIO(create_pdf_with_pages([text_page("Visible text")])))
+
+    without_sink = detect_empty.detect_page_decisions(reader, treat_annotations_as_empty=True)
+    assert calls == []
+
+    records: list[dict[str, object]] = []
+    with_sink = detect_empty.detect_page_decisions(
+        reader,
+        treat_annotations_as_empty=True,
+        debug_sink=records.append,
+    )
+    assert calls == ["merge", "summary"]
+    assert with_sink == without_sink
+    assert len(records) == 1
+    stream_preview = records[0]["content_streams"][0]
+    contents = reader.pages[0].get_contents()
+    assert stream_preview["sha256"] == hashlib.sha256(contents.get_data()).hexdigest()
+
+
+def test_structural_debug_does_not_change_edited_output(tmp_path: Path) -> None:
+    input_path = write_pdf_with_pages(
+        tmp_path / "sample.pdf",
+        page_specs=[text_page("cover"), empty_page(), text_page("appendix")],
+    )
+    config = RunConfig(
+        path=str(tmp_path),
+        out=str(tmp_path / "plain"),
+        report_dir=str(tmp_path / "reports"),
+        mode="structural",
+        effective_mode="structural",
+        render_dpi=72,
+        ink_threshold=0.0005,
+        background="white",
+        effective_background="white",
+        render_sample_margin=(0.0, 0.0, 0.0, 0.0),
+        white_threshold=250,
+        stamp_page_numbers=False,
+        stamp_page_numbers_force=False,
+        pagenum_box=None,
+        pagenum_size=10.0,
+        pagenum_font="Helvetica",
+        pagenum_format="{page}",
+        recursive=False,
+        write_when_unchanged=False,
+        treat_annotations_as_empty=True,
+        dry_run=False,
+        debug_structural=False,
+        debug_pypdf_xref=False,
+        strict_xref=False,
+        debug_render=False,
+        verbose=False,
+    )
+
+    plain = process_pdf(input_path=input_path, out_dir=tmp_path / "plain", config=config)
+    debug = process_pdf(
+        input_path=input_path,
+        out_dir=tmp_path / "debug",
+        config=dataclasses.replace(config, debug_structural=True),
+    )
+
+    assert plain.status == debug.status == "edited"
+    assert debug.structural_debug_path is not None
+    assert plain.output_path is not None and debug.output_path is not None
+    assert Path(debug.output_path).read_bytes() == Path(plain.output_path).read_bytes()